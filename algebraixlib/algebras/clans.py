@@ -126,8 +126,18 @@ class Algebra:
             assert is_member_or_undef(clan2)
             if clan1 is _undef.Undef() or clan2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
-        result = _extension.binary_extend(clan1, clan2, _functools.partial(
-            _sets.union, _checked=False), _checked=False)
+        if clan1.cardinality == 1 or clan2.cardinality == 1:
+            # One of the clans has a single relation; add its couplets to every relation of the
+            # other clan.
+            single_rel, other_clan = (next(iter(clan1)), clan2) if clan1.cardinality == 1 \
+                else (next(iter(clan2)), clan1)
+            result = _mo.Set(
+                (_mo.Set(single_rel.data | rel.data, direct_load=True)
+                 .cache_relation(CacheStatus.IS) for rel in other_clan),
+                direct_load=True)
+        else:
+            result = _extension.binary_extend(clan1, clan2, _functools.partial(
+                _sets.union, _checked=False), _checked=False)
         if not result.is_empty:
             result.cache_clan(CacheStatus.IS)
             if clan1.cached_is_not_functional or clan2.cached_is_not_functional:
@@ -158,8 +168,10 @@ class Algebra:
             assert is_member_or_undef(clan2)
             if clan1 is _undef.Undef() or clan2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
-        result = _extension.binary_extend(clan1, clan2, _functools.partial(
-            _relations.functional_union, _checked=False), _checked=False)
+        result = _regular_cross_functional_union(clan1, clan2)
+        if result is None:
+            result = _extension.binary_extend(clan1, clan2, _functools.partial(
+                _relations.functional_union, _checked=False), _checked=False)
         if not result.is_empty:
             result.cache_clan(CacheStatus.IS)
             result.cache_functional(CacheStatus.IS)
@@ -330,8 +342,25 @@ class Algebra:
             assert is_member_or_undef(clan2)
             if clan1 is _undef.Undef() or clan2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
-        result = _extension.binary_extend(clan1, clan2, _functools.partial(
-            _sets.superstrict, _checked=False), _checked=False)
+
+        def _superstrict_relations():
+            # The binary extension of sets.superstrict, without calling it (and creating Undef())
+            # for all the pairs of relations that don't match.
+            if len(clan2) == 1:
+                # A point query (like superstrict(clan, from_dict({...}))): a single filter pass.
+                rel2 = next(iter(clan2))
+                rel2_data = rel2.data
+                for rel1 in clan1:
+                    if rel1.data.issuperset(rel2_data):
+                        yield _sets.superstrict(rel1, rel2, _checked=False)
+                return
+            for rel1 in clan1:
+                for rel2 in clan2:
+                    if rel1.data.issuperset(rel2.data):
+                        yield _sets.superstrict(rel1, rel2, _checked=False)
+                        break
+
+        result = _mo.Set(_superstrict_relations(), direct_load=True)
         if not result.is_empty:
             result.cache_clan(CacheStatus.IS)
             if clan1.cached_is_functional:
@@ -351,6 +380,60 @@ class Algebra:
         return result
 
 
+def _get_regular_rights(clan: 'PP(M x M)'):
+    r"""Return a list with a `dict` (left to right) for every :term:`relation` in ``clan`` if
+    ``clan`` is a non-empty :term:`regular` :term:`clan`, otherwise ``None``.
+
+    No flags are cached on ``clan`` or its relations.
+    """
+    if clan.is_empty or clan.cached_is_not_regular:
+        return None
+    rights_list = []
+    left_set = None
+    for rel in clan:
+        rights = {couplet.left: couplet.right for couplet in rel}
+        if len(rights) != len(rel):
+            return None  # rel is not functional.
+        if left_set is None:
+            left_set = rights.keys()
+        elif rights.keys() != left_set:
+            return None
+        rights_list.append((rel, rights))
+    return rights_list
+
+
+def _regular_cross_functional_union(clan1: 'PP(M x M)', clan2: 'PP(M x M)'):
+    r"""Return the :term:`cross-functional union` of ``clan1`` and ``clan2`` if both are non-empty
+    :term:`regular` :term:`clan`\s, otherwise ``None``.
+
+    All relations of a regular clan are functions with the same :term:`left set`, so the union of
+    two of them is a function exactly if they have the same rights for the lefts that both clans
+    have in common. The relations of ``clan2`` are indexed by these rights (a hash join), so only
+    the pairs that match are unioned.
+    """
+    rights_list1 = _get_regular_rights(clan1)
+    if rights_list1 is None:
+        return None
+    rights_list2 = _get_regular_rights(clan2)
+    if rights_list2 is None:
+        return None
+    common_lefts = tuple(rights_list1[0][1].keys() & rights_list2[0][1].keys())
+
+    rels2_by_key = {}
+    for rel2, rights2 in rights_list2:
+        key = tuple(rights2[left] for left in common_lefts)
+        rels2_by_key.setdefault(key, []).append(rel2)
+
+    def _get_unions():
+        for rel1, rights1 in rights_list1:
+            key = tuple(rights1[left] for left in common_lefts)
+            for rel2 in rels2_by_key.get(key, ()):
+                yield _sets.union(rel1, rel2, _checked=False) \
+                    .cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
+
+    return _mo.Set(_get_unions(), direct_load=True)
+
+
 # For convenience, make the members of class Algebra (they are all static functions) available at
 # the module level.
 # pylint: disable=invalid-name
@@ -680,8 +763,31 @@ def project(clan: 'PP(M x M)', *lefts) -> 'PP(M x M)':
     """
     if not is_member(clan):
         return _undef.make_or_raise_undef2(clan)
-    clan = compose(clan, diag(*lefts))
-    return clan
+    for left in lefts:
+        if left is _undef.Undef():
+            return _undef.make_or_raise_undef(2)
+    # This is compose(clan, diag(*lefts)), but it only checks the lefts of the couplets.
+    lefts_set = frozenset(_mo.auto_convert(left) for left in lefts)
+
+    def _project_relation(rel):
+        result = _mo.Set((couplet for couplet in rel if couplet.left in lefts_set),
+                         direct_load=True)
+        if not result.is_empty:
+            result.cache_relation(CacheStatus.IS)
+            if rel.cached_is_functional:
+                result.cache_functional(CacheStatus.IS)
+            if rel.cached_is_right_functional:
+                result.cache_right_functional(CacheStatus.IS)
+        return result
+
+    result = _mo.Set((_project_relation(rel) for rel in clan), direct_load=True)
+    result.cache_clan(CacheStatus.IS)
+    if not result.is_empty:
+        if clan.cached_is_functional:
+            result.cache_functional(CacheStatus.IS)
+        if clan.cached_is_right_functional:
+            result.cache_right_functional(CacheStatus.IS)
+    return result
 
 
 def from_set(left: '( M )', *values: '( M )') -> 'PP(M x M)':
@@ -18,6 +18,7 @@ of the :term:`algebra of multisets`. These are provided in :mod:`~.algebras.mult
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import collections as _collections
 import functools as _functools
 
 import algebraixlib.algebras.multisets as _multisets
@@ -33,6 +34,74 @@ from ..cache_status import CacheStatus
 
 # --------------------------------------------------------------------------------------------------
 
+def _get_diagonal_lefts(mclan: 'P(P(M x M) x N)'):
+    """If ``mclan`` contains a single relation that is a diagonal (like the result of `diag`),
+    return the set of its lefts and its multiplicity. Otherwise return ``None``.
+    """
+    if len(mclan.data) != 1:
+        return None
+    (rel, multiplicity), = mclan.data.items()
+    lefts = set()
+    for couplet in rel:
+        if couplet.left != couplet.right:
+            return None
+        lefts.add(couplet.left)
+    return lefts, multiplicity
+
+
+def _compose_with_diagonal(mclan: 'P(P(M x M) x N)', lefts: set,
+                           multiplicity: int) -> 'P(P(M x M) x N)':
+    """Return the composition of ``mclan`` with a multiclan that contains a single diagonal with
+    the lefts ``lefts`` and the multiplicity ``multiplicity``.
+
+    Composing a relation with a diagonal keeps the couplets of the relation whose lefts are in the
+    diagonal, so this is a single pass over ``mclan`` that doesn't create any new couplets.
+    """
+    counter = _collections.Counter()
+    for rel, rel_multiplicity in mclan.data.items():
+        projected = _mo.Set((couplet for couplet in rel if couplet.left in lefts),
+                            direct_load=True)
+        if not projected.is_empty:
+            projected.cache_relation(CacheStatus.IS)
+        counter[projected] += rel_multiplicity * multiplicity
+    return _mo.Multiset(counter, direct_load=True)
+
+
+def _rights_by_left(rel: 'P(M x M)') -> dict:
+    """Flatten ``rel`` into a dictionary that maps every left to the list of its rights."""
+    rights_by_left = {}
+    for couplet in rel:
+        rights_by_left.setdefault(couplet.left, []).append(couplet.right)
+    return rights_by_left
+
+
+def _compose_flattened(mclan1: 'P(P(M x M) x N)', mclan2: 'P(P(M x M) x N)') -> 'P(P(M x M) x N)':
+    r"""Return the composition of the :term:`multiclan`\s ``mclan1`` and ``mclan2``.
+
+    The relations of ``mclan1`` are flattened into left-to-rights dictionaries only once (instead
+    of composing every pair of couplets for every pair of relations), so the composition of two
+    relations is a single pass over the couplets of the relation of ``mclan2`` with a dictionary
+    lookup each.
+    """
+    flattened1 = [(_rights_by_left(rel1), multi1) for rel1, multi1 in mclan1.data.items()]
+    items2 = list(mclan2.data.items())
+    counter = _collections.Counter()
+    for rights_by_left, multi1 in flattened1:
+        for rel2, multi2 in items2:
+            composed = []
+            for couplet in rel2:
+                rights = rights_by_left.get(couplet.right)
+                if rights is not None:
+                    left = couplet.left
+                    composed.extend(
+                        _mo.Couplet(left, right, direct_load=True) for right in rights)
+            result = _mo.Set(composed, direct_load=True)
+            if not result.is_empty:
+                result.cache_relation(CacheStatus.IS)
+            counter[result] += multi1 * multi2
+    return _mo.Multiset(counter, direct_load=True)
+
+
 class Algebra:
     """Provide the operations and relations that are members of the :term:`algebra of multiclans`.
 
@@ -95,8 +164,11 @@ class Algebra:
             assert is_member_or_undef(multiclan2)
             if multiclan1 is _undef.Undef() or multiclan2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
-        result = _extension.binary_multi_extend(multiclan1, multiclan2, _functools.partial(
-            _relations.compose, _checked=False), _checked=False)
+        diagonal = _get_diagonal_lefts(multiclan2)
+        if diagonal is not None:
+            result = _compose_with_diagonal(multiclan1, *diagonal)
+        else:
+            result = _compose_flattened(multiclan1, multiclan2)
         if not result.is_empty:
             result.cache_multiclan(CacheStatus.IS)
             if multiclan1.cached_is_absolute and multiclan2.cached_is_absolute:
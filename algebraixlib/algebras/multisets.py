@@ -54,6 +54,11 @@ class Algebra:
             assert is_member_or_undef(multiset2)
             if multiset1 is _undef.Undef() or multiset2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
+        # The union with an empty multiset is the other multiset; no need to copy it.
+        if multiset1.is_empty:
+            return multiset2
+        if multiset2.is_empty:
+            return multiset1
         values = multiset1.data | multiset2.data
         result = _mo.Multiset(values, direct_load=True)
         if not result.is_empty:
@@ -99,7 +104,7 @@ class Algebra:
             if multiset1 is _undef.Undef() or multiset2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
         values = multiset1.data & multiset2.data
-        result = _mo.Multiset(values)
+        result = _mo.Multiset(values, direct_load=True)
         if not result.is_empty:
             # Multiclan flags:
             if multiset1.cached_is_multiclan or multiset2.cached_is_multiclan:
@@ -133,8 +138,11 @@ class Algebra:
             assert is_member_or_undef(multiset2)
             if multiset1 is _undef.Undef() or multiset2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
+        # Subtracting an empty multiset doesn't change anything; no need to copy.
+        if multiset2.is_empty:
+            return multiset1
         values = multiset1.data - multiset2.data
-        result = _mo.Multiset(values)
+        result = _mo.Multiset(values, direct_load=True)
         if not result.is_empty:
             # Multiclan flags:
             if multiset1.cached_is_multiclan:
@@ -169,6 +177,11 @@ class Algebra:
             assert is_member_or_undef(multiset2)
             if multiset1 is _undef.Undef() or multiset2 is _undef.Undef():
                 return _undef.make_or_raise_undef(2)
+        # The addition of an empty multiset is the other multiset; no need to copy it.
+        if multiset1.is_empty:
+            return multiset2
+        if multiset2.is_empty:
+            return multiset1
         values = multiset1.data + multiset2.data
         result = _mo.Multiset(values, direct_load=True)
         if not result.is_empty:
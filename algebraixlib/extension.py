@@ -84,10 +84,13 @@ def binary_multi_extend(multiset1: 'P( M x N )', multiset2: 'P( M x N )', op,
 
     def _get_values(_set1, _set2):
         return_count = _collections.Counter()
+        undef = _undef.Undef()
+        # The inner items are iterated once for every outer element; get them only once.
+        items2 = list(_set2.data.items())
         for elem1, multi1 in _set1.data.items():
-            for elem2, multi2 in _set2.data.items():
+            for elem2, multi2 in items2:
                 result = op(elem1, elem2)
-                if result is not _undef.Undef():
+                if result is not undef:
                     return_count[result] += multi1 * multi2
 
         return return_count
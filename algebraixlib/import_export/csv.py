@@ -19,11 +19,9 @@ import csv as _csv
 
 import algebraixlib.algebras.clans as _clans
 import algebraixlib.algebras.multiclans as _multiclans
-import algebraixlib.algebras.relations as _relations
 # noinspection PyProtectedMember
 import algebraixlib.import_export._util as _util
 import algebraixlib.mathobjects as _mo
-import algebraixlib.undef as _ud
 import algebraixlib.util.miscellaneous as _misc
 
 from ..cache_status import CacheStatus
@@ -65,56 +63,50 @@ def export_csv(absolute_clan_or_multiclan, file_or_path, ordered_lefts=None, sor
         # left_set is sorted to guarantee consistent iterations
         ordered_lefts = sorted([left.value for left in rel.get_left_set()])
 
-    # Generate dictionaries that associates left components with their right components for each
-    # relation.
-    clan_as_list_of_dicts = _convert_clan_to_list_of_dicts(
+    # Generate a row with the right components (in the order of ordered_lefts) for each relation.
+    rows = _convert_clan_to_rows(
         ordered_lefts, (absolute_clan_or_multiclan
             if sort_key is None else sorted(absolute_clan_or_multiclan, key=sort_key)))
-    # Write the dictionaries.
-    _csv_dict_writer(file_or_path, ordered_lefts, clan_as_list_of_dicts)
+    # Write the rows.
+    _csv_writer(file_or_path, ordered_lefts, rows)
     return True
 
 
-def _csv_dict_writer(file_or_path, ordered_columns: _collections.Sequence,
-                     data: _collections.Sequence):
-    """Write a CSV file using `csv.DictWriter`.
+def _csv_writer(file_or_path, ordered_columns: _collections.Sequence, rows):
+    """Write a CSV file using `csv.writer`.
 
     :param file_or_path: Either a file path (in this case the CSV data is written to a file at this
         location) or a file object (in this case the CSV data is written to its ``.write()``
         function).
-    :param ordered_columns: A `Sequence` of column names (atoms). The columns are
-        written in the given order.
-    :param data: A `Sequence` of rows, where each row is a dictionary, mapping a column name to its
-        value in the given row. Both the column name and the value are atoms.
+    :param ordered_columns: A `Sequence` of column names. They are written as header row.
+    :param rows: An iterable of rows, where each row is a `list` of the values in the order of
+        ``ordered_columns``.
     """
     def write_data(out_file):
-        writer = _csv.DictWriter(
-            f=out_file, fieldnames=ordered_columns, dialect='excel')
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
+        writer = _csv.writer(out_file, dialect='excel')
+        writer.writerow(ordered_columns)
+        writer.writerows(rows)
 
     _misc.write_to_file_or_path(file_or_path, write_data)
 
 
-def _convert_clan_to_list_of_dicts(ordered_lefts: 'P( A )', absolute_clan: 'PP(A x A)') -> list:
-    """Convert a regular, absolute clan into a list of dictionaries.
+def _convert_clan_to_rows(ordered_lefts: 'P( A )', absolute_clan: 'PP(A x A)'):
+    """Convert a regular, absolute clan into rows of values.
 
     :param ordered_lefts: The left components of ``absolute_clan`` that are converted.
-    :param absolute_clan: A regular, absolute clan that is converted into a list of dictionaries.
-    :return: A list of dictionaries. Every dictionary represents a single relation in
-        ``absolute_clan``. The lefts of the relation become the keys, the rights become the values
-        of the dictionary.
+    :param absolute_clan: A regular, absolute clan that is converted into rows.
+    :return: A generator of lists. Every list represents a single relation in ``absolute_clan`` and
+        contains the values of the rights of ``ordered_lefts`` (in this order). Lefts that are
+        missing in a relation or that have more than one right are represented by an empty string.
     """
+    left_atoms = [_mo.auto_convert(left) for left in ordered_lefts]
+    ambiguous = object()
     for rel in absolute_clan:
-        left_to_right_dict = {}
-        for left in ordered_lefts:
-            # Get the right component associated with left and add it to our row.
-            right = _relations.get_right(rel, left)
-            if right is not _ud.Undef():
-                left_to_right_dict[left] = right.value
-        # Add right component dictionary to result
-        yield left_to_right_dict
+        rights = {}
+        for couplet in rel:
+            rights[couplet.left] = ambiguous if couplet.left in rights else couplet.right.value
+        row = [rights.get(left, '') for left in left_atoms]
+        yield [('' if value is ambiguous else value) for value in row]
 
 
 def import_csv(csv_file_or_filepath, types: {}=None, skip_rows: int=0, index_column: str=None,
@@ -126,7 +118,8 @@ def import_csv(csv_file_or_filepath, types: {}=None, skip_rows: int=0, index_col
     :param types: (Optional) A dictionary of type conversions. The keys are the column names; the
         values are functors (or types) that receive the string from the CSV cell and return the
         value to be imported. Example: ``{'foo': int, 'bar': float}``. By default all values are
-        interpreted as `string`\s.
+        interpreted as `string`\s. (A functor is called only once for every distinct string in its
+        column.)
     :param skip_rows: (Optional) A number of lines to skip (default 0). Some CSV files have a
         preamble that can be skipped with this option.
     :param index_column: (Optional) A name for an index column. (No index column is created if this
@@ -145,13 +138,6 @@ def import_csv(csv_file_or_filepath, types: {}=None, skip_rows: int=0, index_col
     if types is None:
         types = {}
 
-    def _filter_row(row):
-        """Remove missing and blank elements from the CSV row."""
-        for key, val in row.items():
-            if val is None or val == '':
-                continue
-            yield key, val
-
     _util.get_left_cached.left_cache = {}
     import_csv.regular = True  # Set to false if any row is missing one or more values
 
@@ -160,24 +146,55 @@ def import_csv(csv_file_or_filepath, types: {}=None, skip_rows: int=0, index_col
     def _import_csv(csv_file):
         for _ in range(0, skip_rows):
             next(csv_file)
-        reader = _csv.DictReader(csv_file, fieldnames=columns)
-
-        _index = 0
-        for row in reader:
-            filtered_row = {key: val for key, val in _filter_row(row)}
-            if import_csv.regular and len(row) != len(filtered_row):
+        reader = _csv.reader(csv_file)
+        column_names = next(reader, None) if columns is None else columns
+        if column_names is None:
+            return ()
+
+        # Look up the left atoms and type conversions once per column instead of once per cell.
+        lefts = [_util.get_left_cached(column_name) for column_name in column_names]
+        converters = [types.get(column_name) for column_name in column_names]
+        index_left = None if index_column is None else _util.get_left_cached(index_column)
+        # Values often repeat within a column. For every column, cache the couplet that is created
+        # for a given CSV value, so that we convert and create it only once.
+        couplet_caches = [{} for _ in column_names]
+
+        def _make_relation(row, index=None):
+            if len(row) < len(lefts):
                 import_csv.regular = False
-            for key, val in types.items():
-                if key in filtered_row:
-                    filtered_row[key] = val(filtered_row[key])
-            if index_column is not None:
-                filtered_row[index_column] = _index
-                _index += 1
-            yield _mo.Set(
-                (_mo.Couplet(left=_util.get_left_cached(left), right=_mo.Atom(right),
-                direct_load=True) for left, right in filtered_row.items()), direct_load=True)\
+            couplets = []
+            # Remove missing and blank elements from the CSV row.
+            for left, converter, couplet_cache, val in zip(lefts, converters, couplet_caches, row):
+                if val == '':
+                    import_csv.regular = False
+                    continue
+                couplet = couplet_cache.get(val)
+                if couplet is None:
+                    right = val if converter is None else converter(val)
+                    couplet = _mo.Couplet(left=left, right=_mo.Atom(right), direct_load=True)
+                    couplet_cache[val] = couplet
+                couplets.append(couplet)
+            if index_left is not None:
+                couplets.append(
+                    _mo.Couplet(left=index_left, right=_mo.Atom(index), direct_load=True))
+            return _mo.Set(couplets, direct_load=True)\
                 .cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
 
+        # Skip empty lines.
+        rows = (row for row in reader if len(row) > 0)
+        if has_dup_rows:
+            # Count the duplicate rows first, so that only distinct rows are converted into
+            # relations. (Different rows may still result in the same relation, for example through
+            # the type conversions, so the counts are accumulated per relation.)
+            relation_counts = _collections.Counter()
+            for row, count in _collections.Counter(map(tuple, rows)).items():
+                relation_counts[_make_relation(row)] += count
+            return relation_counts
+        elif index_left is not None:
+            return (_make_relation(row, index) for index, row in enumerate(rows))
+        else:
+            return (_make_relation(row) for row in rows)
+
     if hasattr(csv_file_or_filepath, "readlines"):  # Support StringIO.
         if has_dup_rows:
             return _mo.Multiset(_import_csv(csv_file_or_filepath),
@@ -24,6 +24,8 @@ import algebraixlib.undef as _ud
 import algebraixlib.util.miscellaneous as _misc
 import algebraixlib.util.rdf as _rdf
 
+from ..cache_status import CacheStatus
+
 
 def import_graph(graph_file_or_filepath, rdf_format: str=None) -> 'PP(A x A)':
     r"""Return an absolute clan that represents the RDF graph ``graph_file_or_filepath``.
@@ -334,16 +336,23 @@ def export_table(file_or_path, lefts: 'P( A )', table: 'PP(A x A)', out_format:
 
 def _convert_graph_to_mathobjects(rdflib_graph: _rdflib.Graph) -> 'PP(A x A)':
     """Return a `graph` from the data in the `~_rdflib.Graph` `rdflib_graph`."""
-    return _mo.Set(_make_triple_from_graph(triple_tuple) for triple_tuple in rdflib_graph)
-
-
-def _make_triple_from_graph(triple_tuple) -> 'P(A x A)':
-    """Return a `triple` created from the `~.rdflib` triple tuple ``triple_tuple``."""
-    return _rdf.make_triple(
-        subject=_convert_identifier_to_mathobject(triple_tuple[0]),
-        predicate=_convert_identifier_to_mathobject(triple_tuple[1]),
-        object_=_convert_identifier_to_mathobject(triple_tuple[2])
-    )
+    # Terms repeat across triples (predicates, and the IRIs of resources that are referenced more
+    # than once), so every distinct term is converted only once and its atom is shared.
+    atoms = {}
+
+    def convert(term):
+        key = (type(term), term)
+        atom = atoms.get(key)
+        if atom is None:
+            atom = atoms[key] = _convert_identifier_to_mathobject(term)
+        return atom
+
+    graph = _mo.Set((_rdf.make_triple(convert(subject), convert(predicate), convert(object_))
+                     for subject, predicate, object_ in rdflib_graph), direct_load=True)
+    if not graph.is_empty:
+        graph.cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)\
+            .cache_regular(CacheStatus.IS)
+    return graph
 
 
 def _convert_identifier_to_mathobject(term) -> '( A )':
@@ -14,12 +14,19 @@
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import re as _re
+
 # noinspection PyProtectedMember
 import algebraixlib.import_export._util as _util
 import algebraixlib.mathobjects as _mo
 import algebraixlib.util.miscellaneous as _misc
 
 
+#: The size in bytes of the blocks in which `import_xml` reads the XML data and hands it to the
+#: parser.
+READ_BLOCK_SIZE = 64 * 1024
+
+
 def import_xml(xml_file_or_filepath, convert_numerics: bool=False) -> 'P( A x M )':
     """Import the file ``xml_file_or_filepath`` as XML file and return nested relations.
 
@@ -43,11 +50,21 @@ def import_xml(xml_file_or_filepath, convert_numerics: bool=False) -> 'P( A x M
 
     _get_atom_value = _get_atom_value_convert if convert_numerics else _get_atom_value_direct
 
-    def _process_attributes(node):
-        for (name, value) in node.attributes.items():
+    # The Atoms created so far, by their text. Values that repeat in the data then share a single
+    # Atom instance (and its conversion and hashing are done only once).
+    atoms = {}
+
+    def _get_atom(text: str) -> _mo.Atom:
+        atom = atoms.get(text)
+        if atom is None:
+            atom = atoms[text] = _mo.Atom(_get_atom_value(text), direct_load=True)
+        return atom
+
+    def _process_attributes(attributes: dict):
+        for (name, value) in attributes.items():
             yield _mo.Couplet(
                 left=_util.get_left_cached(name),
-                right=_mo.Atom(_get_atom_value(value), True),
+                right=_get_atom(value),
                 direct_load=True)
 
     text_left = _mo.Atom('$')
@@ -62,43 +79,69 @@ def import_xml(xml_file_or_filepath, convert_numerics: bool=False) -> 'P( A x M
 
     _util.get_left_cached.left_cache = {}
 
-    def _process_nodes(nodes):
-        for node in nodes:
-            if node.nodeType == node.ELEMENT_NODE:
-                # attributes and children are sets of Couplets.
-                attributes = set(_process_attributes(node))
-                children = set(_process_nodes(node.childNodes))  # May include text (text_left).
-                children = children.union(attributes)
-                if len(children) == 1 and _contains_text_node(children):
-                    # We have a single child that is a text node. Remove one layer of couplets.
-                    yield _mo.Couplet(
-                        left=_util.get_left_cached(node.tagName),
-                        right=_misc.get_single_iter_elem(children).right,
-                        direct_load=True)
-                else:
-                    yield _mo.Couplet(
-                        left=_util.get_left_cached(node.tagName),
-                        right=_mo.Set(children, direct_load=True),
-                        direct_load=True)
-            elif node.nodeType == node.TEXT_NODE:
-                text_node_text = node.data.strip()
-                if len(text_node_text) > 0:
-                    yield _mo.Couplet(
-                        left=text_left,
-                        right=_mo.Atom(_get_atom_value(text_node_text), direct_load=True),
-                        direct_load=True)
-            else:
-                assert False  # Node type not supported.
+    def _process_text(element):
+        # Add the text collected since the last child element of element (if any) to its
+        # children.
+        text_node_text = ''.join(element[2]).strip()
+        del element[2][:]
+        if len(text_node_text) > 0:
+            element[1].add(_mo.Couplet(
+                left=text_left,
+                right=_get_atom(text_node_text),
+                direct_load=True))
 
     def _import_xml(xml_file):
-        import xml.dom.minidom
-        tree = xml.dom.minidom.parse(xml_file)
-        return _mo.Set(_process_nodes(tree.childNodes), direct_load=True)
+        import xml.parsers.expat
+        parser = xml.parsers.expat.ParserCreate()
+        # Deliver contiguous text in a single callback instead of one per line or buffer.
+        parser.buffer_text = True
+        # The currently open elements, each as [tag name, set of child Couplets, text chunks].
+        # An element is converted into its Couplet when its end tag is parsed, so only the path
+        # to the current element is held in memory. Like with xml.dom.minidom, tag and attribute
+        # names are the qualified names as they appear in the data.
+        stack = [[None, set(), []]]
+
+        def _start_element(name, attributes):
+            _process_text(stack[-1])
+            # attributes and children are sets of Couplets.
+            stack.append([name, set(_process_attributes(attributes)), []])
+
+        def _end_element(_):
+            element = stack.pop()
+            _process_text(element)
+            tag_name, children, _ = element  # children may include text (text_left).
+            if len(children) == 1 and _contains_text_node(children):
+                # We have a single child that is a text node. Remove one layer of couplets.
+                couplet = _mo.Couplet(
+                    left=_util.get_left_cached(tag_name),
+                    right=_misc.get_single_iter_elem(children).right,
+                    direct_load=True)
+            else:
+                couplet = _mo.Couplet(
+                    left=_util.get_left_cached(tag_name),
+                    right=_mo.Set(children, direct_load=True),
+                    direct_load=True)
+            stack[-1][1].add(couplet)
+
+        def _character_data(data):
+            stack[-1][2].append(data)
+
+        parser.StartElementHandler = _start_element
+        parser.EndElementHandler = _end_element
+        parser.CharacterDataHandler = _character_data
+        while True:
+            buffer = xml_file.read(READ_BLOCK_SIZE)
+            if not buffer:
+                break
+            parser.Parse(buffer, False)
+        parser.Parse(b'', True)
+        return _mo.Set(stack[0][1], direct_load=True)
 
     if hasattr(xml_file_or_filepath, "readlines"):  # support StringIO
         return _import_xml(xml_file_or_filepath)
     else:
-        with open(xml_file_or_filepath, encoding='utf-8') as file:
+        # Let the parser decode the data (as declared in the file, default UTF-8).
+        with open(xml_file_or_filepath, 'rb', buffering=READ_BLOCK_SIZE) as file:
             return _import_xml(file)
 
 
@@ -118,16 +161,11 @@ def xml_to_str(xml_file_or_filepath, indent_text='   ', truncate=True, max_line_
         that contains an ellipsis.) Ignored if 0 or if ``pre_len`` is 0.
     """
 
-    if not hasattr(xml_file_or_filepath, "readlines"):  # support StringIO
-        xml_file_or_filepath = open(xml_file_or_filepath, encoding='utf-8')
-
-    from xml.dom.minidom import parse
-    xml_data = parse(xml_file_or_filepath)
-    xml_str = xml_data.toprettyxml(indent_text)
-
-    # Remove duplicate whitespace
-    import re
-    xml_str = re.sub(r"(?<=\n)[ \t\r]*\n", "", xml_str)
+    if hasattr(xml_file_or_filepath, "readlines"):  # support StringIO
+        xml_str = _get_pretty_xml(xml_file_or_filepath, indent_text)
+    else:
+        with open(xml_file_or_filepath, encoding='utf-8') as xml_file:
+            xml_str = _get_pretty_xml(xml_file, indent_text)
     if not truncate:
         return xml_str
 
@@ -139,10 +177,19 @@ def xml_to_str(xml_file_or_filepath, indent_text='   ', truncate=True, max_line_
             return matchobj.group(0)[:max_line_len - len_foo] + ellipses
         return matchobj.group(0)
 
-    xml_str = re.sub(r">.*<", _truncator, xml_str)
+    xml_str = _re.sub(r">.*<", _truncator, xml_str)
 
     if pre_len > 0 > post_len:
         return xml_str[:pre_len] + '\n...\n' + xml_str[post_len:]
 
     return xml_str
 
+
+def _get_pretty_xml(xml_file, indent_text: str) -> str:
+    """Return the XML data in the file object ``xml_file`` as consistently formatted string."""
+    from xml.dom.minidom import parse
+    xml_data = parse(xml_file)
+    xml_str = xml_data.toprettyxml(indent_text)
+
+    # Remove duplicate whitespace
+    return _re.sub(r"(?<=\n)[ \t\r]*\n", "", xml_str)
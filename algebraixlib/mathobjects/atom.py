@@ -140,11 +140,15 @@ class Atom(MathObject):
         Type-matching follows Python rules, so ``not Atom(1) == Atom(1.0)``.
         """
         if isinstance(other, Atom):
+            # Atoms with different hashes can't be equal.
+            if other._hash != self._hash:
+                return False
             # NOTE: using the explicit type check vs isinstance(other.value, type(self.value)
             # ..to prevent True being compared equal to 1..ie isinstance(True, type(1)) == True
-            if other.type != self.type:
+            # noinspection PyPep8
+            if type(other._value) != type(self._value):
                 return False
-            return other.value == self.value
+            return other._value == self._value
         return NotImplemented
 
     def __ne__(self, other):
@@ -153,12 +157,15 @@ class Atom(MathObject):
         Type-matching follows Python rules, so ``Atom(1) != Atom(1.0)``.
         """
         if isinstance(other, Atom):
+            # Atoms with different hashes can't be equal.
+            if other._hash != self._hash:
+                return True
             # NOTE: using the explicit type check vs isinstance(other.value, type(self.value)
             # ..to prevent True being compared equal to 1..ie isinstance(True, type(1)) == True
             # noinspection PyPep8
-            if type(other.value) != type(self.value):
+            if type(other._value) != type(self._value):
                 return True
-            return other.value != self.value
+            return other._value != self._value
         return NotImplemented
 
     # noinspection PyUnresolvedReferences
@@ -127,14 +127,22 @@ class Couplet(MathObject):
 
     def __eq__(self, other):
         """A value-based comparison for equality. Return ``True`` if type and both members match."""
-        return isinstance(other, Couplet) \
-            and (self.left == other.left) and (self.right == other.right)
+        if not isinstance(other, Couplet):
+            return False
+        # Couplets with different (already calculated) hashes can't be equal.
+        if self._hash and other._hash and self._hash != other._hash:
+            return False
+        return (self._left == other._left) and (self._right == other._right)
 
     def __ne__(self, other):
         """A value-based comparison for inequality. Return ``True`` if type or members don't match.
         """
-        return not isinstance(other, Couplet) \
-            or (self.left != other.left) or (self.right != other.right)
+        if not isinstance(other, Couplet):
+            return True
+        # Couplets with different (already calculated) hashes can't be equal.
+        if self._hash and other._hash and self._hash != other._hash:
+            return True
+        return (self._left != other._left) or (self._right != other._right)
 
     def __lt__(self, other):
         """A value-based comparison for less than. Return ``True`` if ``self < other``.
@@ -155,8 +163,10 @@ class Couplet(MathObject):
     def __hash__(self):
         """Return a hash based on the value that is calculated on demand and cached."""
         if not self._hash:
+            # Hash the components as a tuple, so that the hash depends on their order. (Summing
+            # their hashes would give a couplet and its transpose the same hash.)
             self._hash = _misc.get_hash(
-                'algebraixlib.mathobjects.couplet.Couplet', self.left, self.right)
+                'algebraixlib.mathobjects.couplet.Couplet', (self.left, self.right))
         return self._hash
 
     def __repr__(self):
@@ -109,11 +109,12 @@ class Multiset(MathObject):
             # A Multiset as argument: create a Multiset that contains a Multiset.
             self._data = _collections.Counter({elements: 1})
         elif isinstance(elements, _collections.Counter) or isinstance(elements, dict):
-            self._data = _collections.Counter()
-            for key in elements.keys():
-                if direct_load:
-                    self._data[key] = elements[key]
-                else:
+            if direct_load:
+                # Copy the mapping in one step.
+                self._data = _collections.Counter(elements)
+            else:
+                self._data = _collections.Counter()
+                for key in elements.keys():
                     # only asserting in non direct mode, assumption is direct load has good data.
                     assert isinstance(elements[key], int) and elements[key] > 0
                     self._data[auto_convert(key)] = elements[key]
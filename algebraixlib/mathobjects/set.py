@@ -226,11 +226,11 @@ class Set(MathObject):
 
     def __eq__(self, other):
         """Implement value-based equality. Return ``True`` if type and set elements match."""
-        return isinstance(other, Set) and (self.data == other.data)
+        return self is other or (isinstance(other, Set) and (self._data == other._data))
 
     def __ne__(self, other):
         """Implement value-based inequality. Return ``True`` if type or set elements don't match."""
-        return not isinstance(other, Set) or (self.data != other.data)
+        return self is not other and (not isinstance(other, Set) or (self._data != other._data))
 
     def __lt__(self, other):
         """A value-based comparison for less than. Return ``True`` if ``self < other``.
@@ -348,12 +348,9 @@ class Set(MathObject):
     def _getitem_clan(self, left):
         """Return a set with the rights of all the couplets in all relations that have a left of
         ``left``."""
-        result = Set()
-        for rel in self:
-            rel_result = rel[left]
-            if rel_result is not _undef.Undef():
-                result = Set(result.data.union(rel_result.data), direct_load=True)
-        return result
+        left_mo = auto_convert(left)
+        return Set((couplet.right for rel in self for couplet in rel if couplet.left == left_mo),
+                   direct_load=True)
 
     # noinspection PyMethodMayBeStatic,PyUnusedLocal
     def _getitem_undef(self, left):  # pylint: disable=unused-argument, no-self-use
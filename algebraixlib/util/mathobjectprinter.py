@@ -66,55 +66,62 @@ def mo_to_str(math_object: _mo.MathObject, abbreviated=False, indent_text='   ',
             return '}'
         return '})'
 
-    mo_str = ''
-
-    if math_object.is_atom:
+    def _atom_text(atom):
         if abbreviated:
-            mo_str = str(math_object)
+            return str(atom)
+        return repr(atom)
+
+    # The pieces of the string, joined at the end. (Concatenating the strings at every level of
+    # the recursion would copy the text of the nested elements once per level.)
+    parts = []
+
+    def _append(math_object, indent):
+        if math_object.is_atom:
+            parts.append(_atom_text(math_object))
+
+        elif math_object.is_couplet:
+            start = len(parts)
+            parts.append(indent + _couplet_pre_text() + _couplet_left_text())
+            _append(math_object.left, indent + indent_text)
+            parts.append(_couplet_seperator_text() + _couplet_right_text())
+            if math_object.right.is_set:
+                parts.append('\n')
+
+            if math_object.right.is_atom:
+                right = _atom_text(math_object.right)
+                line_len = sum(len(part) for part in parts[start:])
+                if line_len + len(right) > max_line_len:
+                    pos = max_line_len - len('...') - line_len - len(right) \
+                        - len(_couplet_post_text() + '\n')
+                    right = right[:pos]
+                    right += '...'
+                parts.append(right)
+            else:
+                _append(math_object.right, indent + indent_text)
+
+            if math_object.right.is_set:
+                parts.append(indent)
+            parts.append(_couplet_post_text() + '\n')
+
+        elif math_object.is_set or math_object.is_multiset:
+            parts.append(indent + _set_pre_text('Set' if math_object.is_set else 'Multiset'))
+
+            for sub in math_object:
+                if sub.is_set or sub.is_couplet:
+                    parts.append('\n')
+                break
+
+            i = len(math_object) - 1
+            for sub in math_object:
+                _append(sub, indent + indent_text)
+                if sub.is_atom and i > 0:
+                    parts.append(', ')
+                    i -= 1
+            parts.append(indent + _set_post_text() + '\n')
+
         else:
-            mo_str = repr(math_object)
-
-    elif math_object.is_couplet:
-        mo_str += indent + _couplet_pre_text() + _couplet_left_text()
-        mo_str += mo_to_str(
-            math_object.left, abbreviated, indent_text, indent + indent_text, max_line_len)
-        mo_str += _couplet_seperator_text() + _couplet_right_text()
-        if math_object.right.is_set:
-            mo_str += '\n'
-        right = mo_to_str(
-            math_object.right, abbreviated, indent_text, indent + indent_text, max_line_len)
-
-        if math_object.right.is_atom:
-            if len(mo_str) + len(right) > max_line_len:
-                pos = max_line_len - len('...') - len(mo_str) - len(right) \
-                    - len(_couplet_post_text() + '\n')
-                right = right[:pos]
-                right += '...'
-
-        mo_str += right
-
-        if math_object.right.is_set:
-            mo_str += indent
-        mo_str += _couplet_post_text() + '\n'
-
-    elif math_object.is_set or math_object.is_multiset:
-        mo_str += indent + _set_pre_text('Set' if math_object.is_set else 'Multiset')
-
-        for sub in math_object:
-            if sub.is_set or sub.is_couplet:
-                mo_str += '\n'
-            break
-
-        i = len(math_object) - 1
-        for sub in math_object:
-            mo_str += mo_to_str(sub, abbreviated, indent_text, indent + indent_text, max_line_len)
-            if sub.is_atom and i > 0:
-                mo_str += ', '
-                i -= 1
-        mo_str += indent + _set_post_text() + '\n'
-
-    else:
-        raise AssertionError('Type {type} not yet implemented'.format(type=type(math_object)))
-
-    return mo_str
+            raise AssertionError('Type {type} not yet implemented'.format(type=type(math_object)))
+
+    _append(math_object, indent)
+    return ''.join(parts)
 
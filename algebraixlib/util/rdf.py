@@ -37,6 +37,7 @@ API
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
 import os as _os
+import sys as _sys
 import urllib.parse as _urlparse
 import urllib.request as _urlreq
 
@@ -45,6 +46,14 @@ import algebraixlib.algebras.properties as _properties
 import algebraixlib.algebras.relations as _relations
 import algebraixlib.mathobjects as _mo
 
+from ..cache_status import CacheStatus
+
+
+# The lefts of the triples, shared by all triples that `make_triple` creates.
+_subject_left = _mo.Atom('s')
+_predicate_left = _mo.Atom('p')
+_object_left = _mo.Atom('o')
+
 
 # --------------------------------------------------------------------------------------------------
 
@@ -84,10 +93,10 @@ def make_triple(subject: '( M )', predicate: '( M )', object_: '( M )') -> 'P(A
     converts to an :class:`~.Atom` in the :class:`~.Couplet` constructor.
     """
     return _mo.Set([
-        _mo.Couplet(left='s', right=subject),
-        _mo.Couplet(left='p', right=predicate),
-        _mo.Couplet(left='o', right=object_),
-    ])
+        _mo.Couplet(left=_subject_left, right=_mo.auto_convert(subject), direct_load=True),
+        _mo.Couplet(left=_predicate_left, right=_mo.auto_convert(predicate), direct_load=True),
+        _mo.Couplet(left=_object_left, right=_mo.auto_convert(object_), direct_load=True),
+    ], direct_load=True).cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
 
 
 def is_graph(obj: _mo.MathObject) -> bool:
@@ -123,7 +132,9 @@ def triple_match(rdf_graph: 'PP(A x M)', subject=None, predicate=None, object_=N
     def add(rdf_left, value):
         if value is not None:
             if isinstance(value, str) and value[0] in '?$':
-                projection[rdf_left] = value
+                # Variable names become lefts of the result; interning them lets the atoms that
+                # are created for them compare by identity.
+                projection[rdf_left] = _sys.intern(value) if type(value) is str else value
             else:
                 pattern[rdf_left] = value
 
@@ -145,6 +156,178 @@ def join(rdf_solution1, rdf_solution2, *rdf_solutions):
     return result
 
 
+def multi_triple_match_join(rdf_graph: 'PP(A x M)', patterns, join_var: str) -> 'PP(A x M)':
+    """Evaluate several triple patterns that share their subject variable and join the matches.
+
+    The result is the same as that of ``join(*[triple_match(rdf_graph, join_var, predicate,
+    object_) for predicate, object_ in patterns])``, but ``rdf_graph`` is traversed only once (to
+    index its triples by subject) and no intermediate clans are created. Like `join`, the result
+    only contains functional matches (a variable that appears more than once must match the same
+    value), also for a single pattern; this is the same as with `evaluate_bgp`.
+
+    :param rdf_graph: The `graph` on which to operate.
+    :param patterns: A sequence of ``(predicate, object_)`` pairs. Each element of a pair is handled
+        like the argument of the same name of `triple_match`.
+    :param join_var: The variable name (starting with ``'?'`` or ``'$'``) of the subjects. It is
+        shared by all patterns.
+    :return: A :term:`clan` with the matches.
+    """
+    assert is_graph(rdf_graph)
+    assert isinstance(join_var, str) and join_var[0] in '?$'
+
+    # For every pattern, collect the values that must match and the variables that are bound,
+    # each with the index of the component (0: predicate, 1: object) in the indexed triples.
+    matchers = []
+    for pattern in patterns:
+        values = []
+        variables = []
+        for index, value in enumerate(pattern):
+            if value is not None:
+                if isinstance(value, str) and value[0] in '?$':
+                    variables.append((index, _mo.Atom(value)))
+                else:
+                    values.append((index, _mo.auto_convert(value)))
+        matchers.append((values, variables))
+
+    # Index the (predicate, object) pairs of all triples by their subject.
+    triples_by_subject = {}
+    for triple in rdf_graph:
+        components = {couplet.left.value: couplet.right for couplet in triple}
+        triples_by_subject.setdefault(components['s'], []).append(
+            (components['p'], components['o']))
+
+    join_left = _mo.Atom(join_var)
+    solutions = []
+    for subject, pred_objs in triples_by_subject.items():
+        # Like `join`, only keep the combinations of matches that are functional.
+        subject_solutions = [{join_left: subject}]
+        for values, variables in matchers:
+            joined = []
+            for pred_obj in pred_objs:
+                if any(pred_obj[index] != value for index, value in values):
+                    continue
+                for solution in subject_solutions:
+                    extended = dict(solution)
+                    for index, variable in variables:
+                        if extended.setdefault(variable, pred_obj[index]) != pred_obj[index]:
+                            break
+                    else:
+                        joined.append(extended)
+            subject_solutions = joined
+            if not subject_solutions:
+                break
+        solutions.extend(subject_solutions)
+
+    return _mo.Set((_mo.Set((_mo.Couplet(left, right, direct_load=True)
+                             for left, right in solution.items()), direct_load=True)
+                    .cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
+                    for solution in solutions), direct_load=True)\
+        .cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+
+
+def evaluate_bgp(rdf_graph: 'PP(A x M)', patterns, executor=None) -> 'PP(A x M)':
+    """Evaluate a basic graph pattern; that is, join the matches of several triple patterns.
+
+    The result is the same as that of ``join(*[triple_match(rdf_graph, *pattern) for pattern in
+    patterns])``. The patterns are evaluated in the order of their estimated number of matches (the
+    number of triples with the pattern's predicate), so that the most selective patterns keep the
+    intermediate results small, and the matches are joined with a hash join on their shared
+    variables. Like `join`, the result only contains functional matches (a variable that appears
+    more than once must match the same value), also for a single pattern.
+
+    :param rdf_graph: The `graph` on which to operate.
+    :param patterns: A non-empty sequence of ``(subject, predicate, object_)`` tuples. Each element
+        of a tuple is handled like the argument of the same name of `triple_match`.
+    :param executor: (Optional) A `concurrent.futures.Executor` on which the patterns are matched
+        concurrently; only the joins run in the calling thread. (With a ``ProcessPoolExecutor``,
+        the triples that a pattern can match are pickled for every pattern, so this only pays off
+        for expensive patterns.) By default the patterns are matched one after the other.
+    :return: A :term:`clan` with the matches.
+    """
+    assert is_graph(rdf_graph)
+    assert len(patterns) > 0
+    # Partition the triples by predicate once for all patterns; a pattern with a given predicate
+    # only needs to be matched against the triples with this predicate.
+    triples_by_predicate = _partition_by_predicate(rdf_graph)
+
+    def get_pattern_graph(pattern):
+        predicate = pattern[1]
+        if predicate is None or (isinstance(predicate, str) and predicate[0] in '?$'):
+            return rdf_graph
+        return triples_by_predicate.get(_mo.auto_convert(predicate))
+
+    pattern_graphs = [get_pattern_graph(pattern) for pattern in patterns]
+    if any(pattern_graph is None for pattern_graph in pattern_graphs):
+        return _mo.Set()  # No triple has the predicate of one of the patterns.
+    ordered = sorted(zip(pattern_graphs, patterns), key=lambda graph_pattern: len(graph_pattern[0]))
+    if executor is None:
+        all_matches = (triple_match(pattern_graph, *pattern) for pattern_graph, pattern in ordered)
+    else:
+        all_matches = executor.map(_triple_match_pattern, *zip(*ordered))
+
+    result = None
+    for matches in all_matches:
+        result = matches if result is None else _hash_join(result, matches)
+        if result.is_empty:
+            break
+    if len(patterns) == 1:
+        # The joins only keep the functional matches; do the same for a single pattern.
+        result = _mo.Set((rel for rel, _ in _get_functions(result)), direct_load=True)\
+            .cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+    return result
+
+
+def _triple_match_pattern(rdf_graph: 'PP(A x M)', pattern) -> 'PP(A x M)':
+    """Return `triple_match` of ``rdf_graph`` with the arguments in the tuple ``pattern``. (A
+    module-level function, so that it can be sent to other processes.)"""
+    return triple_match(rdf_graph, *pattern)
+
+
+def _hash_join(clan1: 'PP(A x M)', clan2: 'PP(A x M)') -> 'PP(A x M)':
+    """Return the :term:`cross-functional union` of the :term:`regular` clans ``clan1`` and
+    ``clan2``, using a hash join on their shared lefts."""
+    # Skip relations that are not functional; they can't be part of a functional union.
+    functions1 = list(_get_functions(clan1))
+    functions2 = list(_get_functions(clan2))
+    if not functions1 or not functions2:
+        return _mo.Set()
+    shared_lefts = [left for left in functions1[0][1] if left in functions2[0][1]]
+
+    index = {}
+    for rel2, rights2 in functions2:
+        index.setdefault(tuple(rights2[left] for left in shared_lefts), []).append(rel2)
+    joined = []
+    for rel1, rights1 in functions1:
+        for rel2 in index.get(tuple(rights1[left] for left in shared_lefts), ()):
+            joined.append(_mo.Set(rel1.data | rel2.data, direct_load=True)
+                          .cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS))
+    return _mo.Set(joined, direct_load=True)\
+        .cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+
+
+def _get_functions(clan: 'PP(A x M)'):
+    """Yield every functional relation in ``clan`` together with a `dict` that maps its lefts to
+    its rights."""
+    for rel in clan:
+        rights = {couplet.left: couplet.right for couplet in rel}
+        if len(rights) == len(rel):
+            yield rel, rights
+
+
+def _partition_by_predicate(rdf_graph: 'PP(A x M)') -> dict:
+    """Return a dictionary that maps every predicate in ``rdf_graph`` to the `graph` of the triples
+    in ``rdf_graph`` that have this predicate."""
+    triples = {}
+    for triple in rdf_graph:
+        for couplet in triple:
+            if couplet.left.value == 'p':
+                triples.setdefault(couplet.right, []).append(triple)
+    return {predicate: _mo.Set(predicate_triples, direct_load=True)
+            .cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+            .cache_regular(CacheStatus.IS)
+            for predicate, predicate_triples in triples.items()}
+
+
 def _check_triple(obj: 'P(A x M)') -> bool:
     """Return ``True`` if ``obj`` is a :term:`triple`, ``False`` if not.
 
@@ -192,5 +375,16 @@ def pattern_match(graph: 'PP( AxA )', pattern: dict):
         :term:`right`\s that will be matched.
     """
     assert _clans.is_member(graph)
-    match_predicate = _clans.from_dict(pattern)
-    return _clans.superstrict(graph, match_predicate, _checked=False)
+    # This is the superstriction of ``graph`` with the clan that contains ``pattern`` as its only
+    # relation. With a single relation to match, it reduces to one subset test per relation.
+    pattern_couplets = _relations.from_dict(pattern).data
+    matches = _mo.Set((rel for rel in graph if pattern_couplets <= rel.data), direct_load=True)
+    if not matches.is_empty:
+        matches.cache_clan(CacheStatus.IS)
+        if graph.cached_is_functional:
+            matches.cache_functional(CacheStatus.IS)
+        if graph.cached_is_right_functional:
+            matches.cache_right_functional(CacheStatus.IS)
+        if graph.cached_is_regular:
+            matches.cache_regular(CacheStatus.IS)
+    return matches
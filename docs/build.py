@@ -29,13 +29,20 @@ Keyword arguments:
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import concurrent.futures
 import filecmp
+import hashlib
+import io
 import os
 import shutil
 # noinspection PyPackageRequirements
 import sphinx
 # noinspection PyPackageRequirements
 import sphinx.apidoc
+# noinspection PyPackageRequirements
+import sphinx.application
+import sys
+import threading
 import webbrowser
 
 
@@ -60,6 +67,9 @@ _apidoc_format = ['--no-toc', '--separate', '--module-first']
 # The base directory for the parsed sources (relative to this file's directory).
 _rst_base_dir = '_source'
 _rst_temp_dir = _rst_base_dir + '.temp'
+# The manifest of the content of _rst_base_dir after the last sync (relative to this file's
+# directory).
+_rst_manifest_file = _rst_base_dir + '.manifest'
 
 # The base directory for the output in target formats (relative to this file's directory).
 _build_output_dir = '_build'
@@ -67,9 +77,36 @@ _build_output_dir = '_build'
 
 # Sphinx build -------------------------------------------------------------------------------------
 
+def _run_builder(builder, doctree_dir, build_output_dir, status=None, warning=None):
+    """Run a single Sphinx builder in-process and return its status code.
+
+    The builder uses the pickled environment in ``doctree_dir`` if it is up to date, so only the
+    first builder that runs actually parses the .rst sources.
+    """
+    app = sphinx.application.Sphinx(
+        srcdir='.', confdir='.', outdir=build_output_dir, doctreedir=doctree_dir,
+        buildername=builder,
+        status=sys.stdout if status is None else status,
+        warning=sys.stderr if warning is None else warning)
+    app.build()
+    return app.statuscode
+
+
+def _run_builder_captured(builder, doctree_dir, build_output_dir):
+    """Run a single Sphinx builder and return its status code and captured console output.
+
+    This runs in a worker process; the output is captured so that the output of concurrently
+    running builders doesn't interleave.
+    """
+    output = io.StringIO()
+    res = _run_builder(builder, doctree_dir, build_output_dir, status=output, warning=output)
+    return res, output.getvalue()
+
+
 def _build_documentation(working_dir,
         source_packages, builders, apidoc_format=_apidoc_format,
-        rst_base_dir=_rst_base_dir, rst_temp_dir=_rst_temp_dir, build_output_dir=_build_output_dir,
+        rst_base_dir=_rst_base_dir, rst_temp_dir=_rst_temp_dir,
+        rst_manifest_file=_rst_manifest_file, build_output_dir=_build_output_dir,
         skip_apidoc=_skip_apidoc, skip_load_in_browser=False, load_file=None,
         rebuild=False):
 
@@ -85,6 +122,25 @@ def _build_documentation(working_dir,
             for dir_name in os.listdir(directory)
                 if os.path.isdir(os.path.join(directory, dir_name))]
 
+    def get_manifest(directory):
+        """Return a manifest of the files under ``directory``: a line with the relative path and
+        a hash of the content for every file."""
+        lines = []
+        for dir_path, subdir_list, file_list in os.walk(directory):
+            for file_name in file_list:
+                file_path = os.path.join(dir_path, file_name)
+                with open(file_path, 'rb') as file:
+                    digest = hashlib.blake2b(file.read()).hexdigest()
+                lines.append(os.path.relpath(file_path, directory) + ' ' + digest)
+        return '\n'.join(sorted(lines)) + '\n'
+
+    def read_manifest(manifest_file):
+        """Return the content of ``manifest_file``, or ``None`` if it doesn't exist."""
+        if not os.path.isfile(manifest_file):
+            return None
+        with open(manifest_file, 'r') as file:
+            return file.read()
+
     def sync_dir(temp_dir, file_names, rst_base_dir_, rst_temp_dir_):
         """Sync the in ``temp_dir`` with the corresponding files under ``_rst_base_dir``. The
         list of files should match ``file_names``."""
@@ -100,6 +156,7 @@ def _build_documentation(working_dir,
                 if not os.path.isdir(source_subdir):
                     shutil.rmtree(target_subdir)
 
+        moved_files = set()
         assert os.path.isdir(source_dir)
         if not os.path.isdir(source_dir):
             if os.path.isdir(target_dir):
@@ -108,26 +165,38 @@ def _build_documentation(working_dir,
             if os.path.isdir(target_dir):
                 source_files = get_files_in_dir(source_dir)
                 target_files = get_files_in_dir(target_dir)
+                source_file_set = set(source_files)
+                target_file_set = set(target_files)
+                # Hard links only work within a single file system.
+                same_device = os.stat(source_dir).st_dev == os.stat(target_dir).st_dev
                 for file in source_files:
                     source_file_path = os.path.join(source_dir, file)
                     target_file_path = os.path.join(target_dir, file)
-                    if not os.path.isfile(target_file_path):
-                        # Copy missing files.
-                        shutil.copy2(source_file_path, target_file_path)
-                        # Copy mismatched files.
+                    if file not in target_file_set:
+                        # Link (or copy) missing files.
+                        if same_device:
+                            os.link(source_file_path, target_file_path)
+                        else:
+                            shutil.copy2(source_file_path, target_file_path)
                     elif not filecmp.cmp(source_file_path, target_file_path, shallow=False):
-                        shutil.copy2(source_file_path, target_file_path)
+                        # Move mismatched files. (The temp directory is deleted after the sync.)
+                        try:
+                            os.replace(source_file_path, target_file_path)
+                            moved_files.add(file)
+                        except OSError:
+                            shutil.copy2(source_file_path, target_file_path)
                 for file in target_files:
-                    source_file_path = os.path.join(source_dir, file)
-                    target_file_path = os.path.join(target_dir, file)
-                    if not os.path.isfile(source_file_path):
+                    if file not in source_file_set:
                         # Delete files in target that shouldn't be there.
-                        os.remove(target_file_path)
+                        os.remove(os.path.join(target_dir, file))
             else:
                 shutil.copytree(source_dir, target_dir)
-        # Make sure everything matches now.
-        match, mismatch, error = filecmp.cmpfiles(source_dir, target_dir, file_names, shallow=False)
-        assert len(match) == len(file_names) and len(mismatch) == 0 and len(error) == 0
+        # Make sure everything matches now. (Moved files are no longer in the source directory.)
+        compared_files = [file for file in file_names if file not in moved_files]
+        match, mismatch, error = filecmp.cmpfiles(
+            source_dir, target_dir, compared_files, shallow=False)
+        assert len(match) == len(compared_files) and len(mismatch) == 0 and len(error) == 0
+        assert all(os.path.isfile(os.path.join(target_dir, file)) for file in moved_files)
 
     current_dir = os.getcwd()
     os.chdir(working_dir)
@@ -135,15 +204,20 @@ def _build_documentation(working_dir,
     build_output_dir = os.path.abspath(build_output_dir)
     rst_base_dir = os.path.abspath(rst_base_dir)
     rst_temp_dir = os.path.abspath(rst_temp_dir)
+    rst_manifest_file = os.path.abspath(rst_manifest_file)
 
     try:
         if rebuild:
             print('...rebuilding (with clean build directories)...')
+            if os.path.isfile(rst_manifest_file):
+                os.remove(rst_manifest_file)
             for dir_to_clean in [rst_base_dir, build_output_dir]:
                 if os.path.isdir(dir_to_clean):
-                    import time
-                    shutil.rmtree(dir_to_clean)
-                    time.sleep(1)
+                    # Move the directory out of the way (a single rename) and delete it in the
+                    # background, so that the deletion overlaps with the build.
+                    trash_dir = dir_to_clean + '.trash.' + str(os.getpid())
+                    os.rename(dir_to_clean, trash_dir)
+                    threading.Thread(target=shutil.rmtree, args=(trash_dir,)).start()
                     os.mkdir(dir_to_clean)
 
         # Run sphinx-apidoc. Create the API .rst files in _rst_temp_dir, then sync to _rst_base_dir.
@@ -157,23 +231,64 @@ def _build_documentation(working_dir,
                 code_dir = os.path.join('..', package)
                 cmd_opts = ['--force', '-o' + rst_dir, code_dir]
                 sphinx.apidoc.main(['sphinx-apidoc'] + apidoc_format + cmd_opts)
-            # Sync from _rst_temp_dir to _rst_base_dir.
-            if not os.path.isdir(rst_base_dir):
-                os.mkdir(rst_base_dir)
+            # Sync from _rst_temp_dir to _rst_base_dir. Skip the sync if the content of
+            # _rst_temp_dir is the same as what was synced the last time.
             if not os.path.isdir(rst_temp_dir):
                 os.mkdir(rst_temp_dir)
-            for dir_path, subdir_list, file_list in os.walk(rst_temp_dir):
-                sync_dir(dir_path, file_list, rst_base_dir, rst_temp_dir)
+            manifest = get_manifest(rst_temp_dir)
+            if not os.path.isdir(rst_base_dir) or manifest != read_manifest(rst_manifest_file):
+                if os.path.isfile(rst_manifest_file):
+                    os.remove(rst_manifest_file)
+                if not os.path.isdir(rst_base_dir):
+                    os.mkdir(rst_base_dir)
+                for dir_path, subdir_list, file_list in os.walk(rst_temp_dir):
+                    sync_dir(dir_path, file_list, rst_base_dir, rst_temp_dir)
+                with open(rst_manifest_file, 'w') as file:
+                    file.write(manifest)
             # Get rid of _rst_temp_dir.
             if os.path.isdir(rst_temp_dir):
                 shutil.rmtree(rst_temp_dir)
 
         # Run sphinx. Convert all .rst files to target formats (builders) into _build_output_dir.
-        for builder in builders:
-            cmd_opts = ['-b', builder, '.', build_output_dir]
-            res = sphinx.build_main(['sphinx-build'] + cmd_opts)
+        # The first builder runs alone (in this process) and (re)creates the pickled environment in
+        # the doctrees directory. The remaining builders then run concurrently in separate
+        # processes. Each of them may write the environment again (for example if it finds an
+        # outdated document), so each gets its own copy of the doctrees directory; it still only
+        # loads the environment and doesn't parse the sources again.
+        doctree_dir = os.path.join(build_output_dir, '.doctrees')
+        failed_builders = []
+        if len(builders) > 0:
+            res = _run_builder(builders[0], doctree_dir, build_output_dir)
             if res != 0:
-                raise RuntimeError('sphinx-build call failed for builder ' + builder)
+                failed_builders.append(builders[0])
+        if len(builders) > 1:
+            builder_doctree_dirs = {}
+            try:
+                for builder in builders[1:]:
+                    builder_doctree_dir = doctree_dir + '.' + builder
+                    if os.path.isdir(builder_doctree_dir):
+                        shutil.rmtree(builder_doctree_dir)
+                    if os.path.isdir(doctree_dir):
+                        shutil.copytree(doctree_dir, builder_doctree_dir)
+                    builder_doctree_dirs[builder] = builder_doctree_dir
+                with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=len(builders) - 1) as executor:
+                    futures = [(builder, executor.submit(
+                        _run_builder_captured, builder, builder_doctree_dirs[builder],
+                        build_output_dir))
+                        for builder in builders[1:]]
+                    for builder, future in futures:
+                        res, output = future.result()
+                        for line in output.splitlines():
+                            print('[{builder}] {line}'.format(builder=builder, line=line))
+                        if res != 0:
+                            failed_builders.append(builder)
+            finally:
+                for builder_doctree_dir in builder_doctree_dirs.values():
+                    shutil.rmtree(builder_doctree_dir, ignore_errors=True)
+        if len(failed_builders) > 0:
+            raise RuntimeError(
+                'Sphinx build failed for builder(s) ' + ', '.join(failed_builders))
 
         # Open the documentation in browser.
         if not skip_load_in_browser:
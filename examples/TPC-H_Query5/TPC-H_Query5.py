@@ -6,6 +6,9 @@ similarly to how it is presented in the notebooks to make it easy to cross-refer
 
 For the code that we used to create the modified data, see the file format_conversions.py in the
 same directory.
+
+Set the environment variable ``ALGX_TIMING`` (to a non-empty value) to print the intermediate
+results, the query result and their timing.
 """
 
 # Copyright Permission.io, Inc. (formerly known as Algebraix Data Corporation), Copyright (c) 2022.
@@ -23,7 +26,9 @@ same directory.
 # If not, see <http://www.gnu.org/licenses/>.
 
 # --------------------------------------------------------------------------------------------------
-from datetime import datetime
+from datetime import date, datetime
+import functools
+import os
 import rdflib
 
 import algebraixlib.algebras.clans as clans
@@ -32,12 +37,29 @@ import algebraixlib.algebras.sets as sets
 import algebraixlib.import_export.csv as csv
 import algebraixlib.import_export.rdf as rdf
 import algebraixlib.import_export.xml as xml
-from algebraixlib.mathobjects import Couplet, Set
+from algebraixlib.mathobjects import Atom, Couplet, Set
 import algebraixlib.partition as partition
 from algebraixlib.util.miscellaneous import FunctionTimer
 
 # --------------------------------------------------------------------------------------------------
 
+class _NullTimer:
+    """A stand-in for `FunctionTimer` that doesn't time or print anything."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def lap(self, *args, **kwargs):
+        pass
+
+    def end(self, *args, **kwargs):
+        pass
+
+
+# The timer used by the query functions. Timing (and the associated prints) is only enabled if the
+# environment variable ALGX_TIMING is set.
+Timer = FunctionTimer if os.environ.get('ALGX_TIMING') else _NullTimer
+
 # Query parameter: region name.
 region_name = 'MIDDLE EAST'
 
@@ -62,7 +84,7 @@ def get_customers_nations_projected(nations):
         ON
             customer.nationkey = nations.nationkey
     """
-    timer = FunctionTimer()
+    timer = Timer()
     short_prints = True
 
     customer_types = {'custkey': int, 'nationkey': int, 'acctbal': float}
@@ -91,11 +113,14 @@ def get_orders_restricted_projected(startdate, enddate):
     :param startdate: The lower boundary (inclusive) of the date range for the column 'orderdate'.
     :param enddate: The upper boundary (exclusive) of the date range for the column 'orderdate'.
     """
-    timer = FunctionTimer()
+    timer = Timer()
     short_prints = True
 
-    def read_date(date_str: str) -> datetime:
-        return datetime.strptime(date_str, '%Y-%m-%d').date()
+    # The dates repeat a lot, so cache them. The fixed format 'YYYY-MM-DD' is parsed directly
+    # (instead of with `strptime`).
+    @functools.lru_cache(maxsize=4096)
+    def read_date(date_str: str) -> date:
+        return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
 
     orders_types = {
         'orderkey': int, 'custkey': int, 'orderdate': read_date,
@@ -131,7 +156,7 @@ def get_supplier_solutions():
             ?supplier <tpch:nationkey> ?nationkey .
         }
     """
-    timer = FunctionTimer()
+    timer = Timer()
     short_prints = True
 
     suppliers = rdf.import_graph('supplier.ttl')
@@ -166,7 +191,7 @@ def get_nations(regionname):
         for $x in doc("regions.xml")/regions/region[name="MIDDLE EAST"]/nation
             return <nation>{$x/nationkey}<nationname>{data($x/name)}</nationname></nation>
     """
-    timer = FunctionTimer()
+    timer = Timer()
     short_prints = True
 
     # Load the XML document. (Don't use multiplicity or sequence; our data doesn't require this.)
@@ -178,7 +203,10 @@ def get_nations(regionname):
     timer.lap('regions_clan', short=short_prints)
 
     # Filter this clan down to the region of interest (name is `regionname`).
-    target_region = clans.superstrict(regions_clan, clans.from_dict({'name': regionname}))
+    # (The region relations are not functional, so use `get_right` instead of `rel('name')`.)
+    regionname_atom = Atom(regionname)
+    target_region = sets.restrict(
+        regions_clan, lambda rel: relations.get_right(rel, 'name') == regionname_atom)
     timer.lap('target_region', short=short_prints)
 
     # Get all 'nation' lefts out of this clan and create a clan where every row is a nation's data.
@@ -214,7 +242,7 @@ def query5():
     #     and orders.orderdate < date '1996-01-01' + interval '1' year
     # group by
     #     n_name
-    timer = FunctionTimer()
+    timer = Timer()
     short_prints = True
 
     # Join supplier_solutions and customers_nations_projected on 'nationkey'.
@@ -235,13 +263,15 @@ def query5():
     result3 = clans.cross_functional_union(result2, csv.import_csv('lineitem.csv', lineitem_types))
     timer.lap('result3', short=short_prints)
 
-    # Add the 'revenue' column.
+    # Calculate the 'revenue' column and keep only the columns 'revenue' and 'nationname'. (This is
+    # the same as adding 'revenue' to every relation and then projecting, but creates only the
+    # relations we need.)
     def calc_revenue(rel):
-        return Couplet('revenue', rel('extendedprice').value * (1 - rel('discount').value))
-    result4 = Set(relations.functional_add(rel, calc_revenue(rel)) for rel in result3)
-    timer.lap('result4', short=short_prints)
-    # Remove unnecessary columns.
-    revenue_by_nations = clans.project(result4, 'revenue', 'nationname')
+        return rel('extendedprice').value * (1 - rel('discount').value)
+    revenue_by_nations = Set(
+        Set(Couplet('revenue', calc_revenue(rel)), Couplet('nationname', rel('nationname')))
+        for rel in result3)
+    timer.lap('revenue_by_nations', short=short_prints)
 
     # Partition the result on 'nationname'.
     revenue_grouped_by_nations = partition.partition(
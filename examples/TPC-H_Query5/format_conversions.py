@@ -19,10 +19,78 @@ functions are only provided in case you want to run the tests (or similar code)
 # If not, see <http://www.gnu.org/licenses/>.
 
 # --------------------------------------------------------------------------------------------------
+import collections
+import concurrent.futures
+import mmap
+import os
 from os import path
 import re
 
 
+# Matches plain decimal numbers (like the numeric values in the TPC-H tables).
+_number_pattern = re.compile(r'-?\d+(\.\d+)?([eE][-+]?\d+)?')
+
+# The block size for converting the (potentially large) table files.
+_input_block_size = 16 * 1024 * 1024
+
+# The buffer size for the (potentially large) output files.
+_output_buffer_size = 16 * 1024 * 1024
+
+
+def _is_number(value: str) -> bool:
+    """Return whether ``value`` is a plain decimal number (optionally negative, with an optional
+    fraction and exponent).
+
+    This is a regex match instead of trying `float(value)`, which is slow for the many non-numeric
+    values because of the exception handling.
+
+    >>> [_is_number(value) for value in ('42', '-283.84', '1e-5', '2.5E+3')]
+    [True, True, True, True]
+    >>> [_is_number(value) for value in ('', '+1', '1.', '.5', '1_000', ' 1', 'inf', 'nan', '#1')]
+    [False, False, False, False, False, False, False, False, False]
+    """
+    return _number_pattern.fullmatch(value) is not None
+
+
+def _read_table_columns(lines, columns: [str]) -> dict:
+    """Read the rows of a TPC-H table file into a dictionary with a list of values per column.
+
+    :param lines: An iterable of lines of a TPC-H table file (for example the open file). Every
+        value is terminated by '|'.
+    :param columns: A list of strings with the column names.
+    :return: A dictionary with the column names as keys and the lists of the column values (in row
+        order) as values.
+    """
+    table_columns = {column: [] for column in columns}
+    column_lists = [table_columns[column] for column in columns]
+    for line in lines:
+        values = line.rstrip('\n').split('|')
+        assert len(values) == len(columns) + 1
+        for column_list, value in zip(column_lists, values):
+            column_list.append(value)
+    return table_columns
+
+
+def _convert_table_lines_to_csv(lines: bytes, column_count: int) -> bytes:
+    """Convert complete lines of a TPC-H table file into CSV lines (with CRLF line endings).
+
+    The conversion works on all lines at once (with `bytes.replace`), instead of line by line.
+
+    :param lines: Zero or more lines of a TPC-H table file, each terminated by a line ending. Every
+        value in a line is terminated by '|'.
+    :param column_count: The number of columns (values) in every line.
+    """
+    if len(lines) == 0:
+        return lines
+    lines = lines.replace(b'\r\n', b'\n')
+    assert lines.count(b'|') == column_count * lines.count(b'\n')
+    # Remove the terminator of the last value and the line ending of the last line, replace the
+    # terminators at the end of the other lines with the quote that ends the last value, the line
+    # ending and the quote that begins the next line, and all other terminators with the quotes and
+    # comma between values.
+    return b'"' + lines[:-2].replace(b'|\n', b'"\r\n"').replace(b'|', b'","') + b'"\r\n'
+
+
 def convert_table_to_csv(table_path: str, columns: [str]):
     """Convert a TPC-H table file into a CSV file with header.
 
@@ -36,28 +104,32 @@ def convert_table_to_csv(table_path: str, columns: [str]):
     base_path = table_path[:-4]
     csv_path = base_path + '.csv'
 
-    with open(table_path, 'r') as table, open(csv_path, 'w', newline='\r\n') as csv:
-        # Get the number of columns by counting the termination character '|' in the first line.
-        # The character terminates every column, and all rows have the same number of columns.
-        separators = re.findall('\\|', table.readline())
-        column_count = len(separators)
-        assert column_count == len(columns)
-        table.seek(0)
+    # The table files are ASCII, so they are processed as bytes (without decoding and encoding).
+    with open(table_path, 'rb') as table, open(csv_path, 'wb') as csv:
+        # Every line has a value for every column. (This is checked during the conversion.)
+        column_count = len(columns)
 
         # Write the CSV header line with the column names.
         csv_header = ','.join(['"{0}"'.format(column) for column in columns])
-        csv.write(csv_header + '\n')
-
-        # Create the regex match pattern (pre-compiled) and the substitution pattern (used as text).
-        table_match_pattern_text = '([^|]*)\\|' * column_count
-        table_match_pattern = re.compile(table_match_pattern_text)
-        csv_subst_pattern_text = ','.join(
-            ['"\\{0}"'.format(count) for count in range(1, column_count + 1)])
-
-        # Apply the regex substitution to every data line and write the result to the CSV file.
-        for line in table:
-            csv_line = re.sub(table_match_pattern, csv_subst_pattern_text, line)
-            csv.write(csv_line)
+        csv.write(csv_header.encode() + b'\r\n')
+
+        # Map the table file into memory and convert the data in large blocks of complete lines.
+        # (Empty files can't be mapped.)
+        if os.fstat(table.fileno()).st_size > 0:
+            with mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ) as table_map:
+                block_start = 0
+                while block_start < len(table_map):
+                    block_end = table_map.rfind(
+                        b'\n', block_start, block_start + _input_block_size) + 1
+                    if block_end <= block_start:
+                        # There is no line ending in the block: the line is longer than a block, or
+                        # it is the last line and not terminated.
+                        block_end = table_map.find(b'\n', block_start) + 1 or len(table_map)
+                    lines = table_map[block_start:block_end]
+                    if not lines.endswith(b'\n'):
+                        lines += b'\n'
+                    csv.write(_convert_table_lines_to_csv(lines, column_count))
+                    block_start = block_end
 
     print(csv_path, 'created.')
 
@@ -80,54 +152,42 @@ def create_regions_xml(dir_path: str=''):
     # Since both the 'region' and the 'nation' files are small, we can read them into memory, then
     # create the output data and write the output file from the data in memory.
 
-    # Create a list `regions` that contains a dictionary for each row in 'region.tbl'.
+    # Read 'region.tbl' and 'nation.tbl' into dictionaries `regions` and `nations` that contain a
+    # list of values for every column.
+    region_columns = ['regionkey', 'name', 'comment']
     with open(region_tbl_path, 'r') as region_table:
-        # Create a regex match pattern where the individual groups are named with the column names.
-        # This makes the match result a dictionary with the column names as keys.
-        region_columns = ['regionkey', 'name', 'comment']
-        pattern_text = ''.join(['(?P<{0}>[^|]*)\\|'.format(column) for column in region_columns])
-        pattern = re.compile(pattern_text)
-
-        regions = []
-        for line in region_table:
-            match = re.match(pattern, line)
-            result = match.groupdict()
-            assert len(result) == len(region_columns)
-            regions.append(result)
-
-    # Create a list `nations` that contains a dictionary for each row in 'nation.tbl'.
+        regions = _read_table_columns(region_table, region_columns)
+    nation_columns = ['nationkey', 'name', 'regionkey', 'comment']
     with open(nation_tbl_path, 'r') as nation_table:
-        # Create a regex match pattern where the individual groups are named with the column names.
-        # This makes the match result a dictionary with the column names as keys.
-        nation_columns = ['nationkey', 'name', 'regionkey', 'comment']
-        pattern_text = ''.join(['(?P<{0}>[^|]*)\\|'.format(column) for column in nation_columns])
-        pattern = re.compile(pattern_text)
-
-        nations = []
-        for line in nation_table:
-            match = re.match(pattern, line)
-            result = match.groupdict()
-            assert len(result) == len(nation_columns)
-            nations.append(result)
+        nations = _read_table_columns(nation_table, nation_columns)
+
+    # Group the nation row indices by their 'regionkey' (in the order in which they appear in
+    # 'nation.tbl').
+    nation_rows_by_regionkey = collections.defaultdict(list)
+    for nation_row, regionkey in enumerate(nations['regionkey']):
+        nation_rows_by_regionkey[regionkey].append(nation_row)
+    # The 'regionkey' of the nations is expressed by the hierarchy, so it is not repeated.
+    nation_xml_columns = [column for column in nation_columns if column != 'regionkey']
 
     # Create a simple XML structure from the table data, placing nations that have a regionkey
-    # that matches the current region's key underneath its associated region.
+    # that matches the current region's key underneath its associated region. The XML lines are
+    # generated one by one and streamed into the file with `writelines`.
+    def generate_xml_lines():
+        yield '<regions>\n'
+        for region_row, regionkey in enumerate(regions['regionkey']):
+            yield '  <region>\n'
+            for key in region_columns:
+                yield '    <' + key + '>' + regions[key][region_row] + '</' + key + '>\n'
+            for nation_row in nation_rows_by_regionkey[regionkey]:
+                yield '    <nation>\n'
+                for key in nation_xml_columns:
+                    yield '      <' + key + '>' + nations[key][nation_row] + '</' + key + '>\n'
+                yield '    </nation>\n'
+            yield '  </region>\n'
+        yield '</regions>\n'
+
     with open(regions_xml_path, 'w') as regions_file:
-        regions_file.write('<regions>\n')
-        for region in regions:
-            regions_file.write('  <region>\n')
-            for key, val in region.items():
-                regions_file.write('    <{key}>{val}</{key}>\n'.format(key=key, val=val))
-            for nation in nations:
-                if nation['regionkey'] == region['regionkey']:
-                    regions_file.write('    <nation>\n')
-                    for key, val in nation.items():
-                        if key != 'regionkey':
-                            regions_file.write('      <{key}>{val}</{key}>\n'.format(
-                                key=key, val=val))
-                    regions_file.write('    </nation>\n')
-            regions_file.write('  </region>\n')
-        regions_file.write('</regions>\n')
+        regions_file.writelines(generate_xml_lines())
 
     print(regions_xml_path, 'created.')
 
@@ -147,35 +207,31 @@ def create_supplier_graph(dir_path: str=''):
     supplier_rdf_path = path.join(dir_path, 'supplier.ttl')
 
     def quote_val(value):
-        # If value can be converted into a number (float), return it as is. Otherwise, return it
+        # If value is a number, return it as is, so that it is read as number. Otherwise, return it
         # double-quoted (and with double quotes doubled up).
-        try:
-            # If this succeeds, `value` represents a number. In this case, we write it as-is
-            # (without quotes), so that it is read as number.
-            float(value)
+        if _is_number(value):
             return value
-        except ValueError:
-            # If the `float(value)` statement failed with a ValueError, treat `value` as string:
-            # enclose it in double quotes and double up any double quotes in the string.
-            return '"{0}"'.format(value.replace('"', '""'))
+        return '"{0}"'.format(value.replace('"', '""'))
 
     with open(supplier_tbl_path, 'r') as supp_tbl, \
-            open(supplier_rdf_path, 'w', newline='\r\n') as supp_ttl:
-        # Create a regex match pattern where the individual groups are named with the column names.
-        # This makes the match result a dictionary with the column names as keys.
+            open(supplier_rdf_path, 'w', newline='\r\n', buffering=_output_buffer_size) \
+            as supp_ttl:
         supp_cols = ['suppkey', 'name', 'address', 'nationkey', 'phone', 'acctbal', 'comment']
-        pattern_text = ''.join(['(?P<{0}>[^|]*)\\|'.format(column) for column in supp_cols])
-        pattern = re.compile(pattern_text)
+        suppkey_index = supp_cols.index('suppkey')
+        # The triples of a supplier are written in the order of the sorted column names. For every
+        # column, precompute its index in the row and the predicate IRI (with the text that
+        # separates it from the subject IRI and the object).
+        predicates = [(supp_cols.index(column_name), '> <tpch:' + column_name + '> ')
+                      for column_name in sorted(supp_cols)]
 
         for line in supp_tbl:
-            match = re.match(pattern, line)
-            result = match.groupdict()
-            assert len(result) == len(supp_cols)
-            supp_iri = 'tpch:supplier-{0}'.format(result['suppkey'])
-            for column_name, column_val in sorted(result.items()):
-                triple = '<{subject_iri}> <tpch:{column_name}> {quoted_val} .\n'.format(
-                    subject_iri=supp_iri, column_name=column_name, quoted_val=quote_val(column_val))
-                supp_ttl.write(triple)
+            values = line.rstrip('\n').split('|')
+            assert len(values) == len(supp_cols) + 1
+            subject = '<tpch:supplier-' + values[suppkey_index]
+            # Write all triples of a supplier with a single write call.
+            supp_ttl.write(''.join(
+                subject + predicate + quote_val(values[index]) + ' .\n'
+                for index, predicate in predicates))
 
     print(supplier_rdf_path, 'created.')
 
@@ -184,17 +240,26 @@ def create_supplier_graph(dir_path: str=''):
 # Call the functions. Customize this section according to what you want to create.
 
 if __name__ == '__main__':
-    # For the XML and RDF graph conversions we assume the current directory; no argument is needed.
-    create_regions_xml()
-    create_supplier_graph()
-
     # The CSV conversions need table file name and column names. We assume the current directory.
-    convert_table_to_csv('customer.tbl', ['custkey', 'name', 'address', 'nationkey', 'phone',
-                                          'acctbal', 'mktsegment', 'comment'])
-    convert_table_to_csv(
-        'orders.tbl', ['orderkey', 'custkey', 'orderstatus', 'totalprice', 'orderdate',
-                       'orderpriority', 'clerk', 'shippriority', 'comment'])
-    convert_table_to_csv(
-        'lineitem.tbl', ['orderkey', 'partkey', 'suppkey', 'linenumber', 'quantity',
-            'extendedprice', 'discount', 'tax', 'returnflag', 'linestatus', 'shipdate',
-            'commitdate', 'receiptdate', 'shipinstruct', 'shipmode', 'comment'])
+    customer_columns = ['custkey', 'name', 'address', 'nationkey', 'phone', 'acctbal',
+                        'mktsegment', 'comment']
+    orders_columns = ['orderkey', 'custkey', 'orderstatus', 'totalprice', 'orderdate',
+                      'orderpriority', 'clerk', 'shippriority', 'comment']
+    lineitem_columns = ['orderkey', 'partkey', 'suppkey', 'linenumber', 'quantity',
+                        'extendedprice', 'discount', 'tax', 'returnflag', 'linestatus', 'shipdate',
+                        'commitdate', 'receiptdate', 'shipinstruct', 'shipmode', 'comment']
+
+    # The conversions are independent of each other, so we run them in parallel processes.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=4) as executor:
+        futures = [
+            # For the XML and RDF graph conversions we assume the current directory; no argument is
+            # needed.
+            executor.submit(create_regions_xml),
+            executor.submit(create_supplier_graph),
+            executor.submit(convert_table_to_csv, 'customer.tbl', customer_columns),
+            executor.submit(convert_table_to_csv, 'orders.tbl', orders_columns),
+            executor.submit(convert_table_to_csv, 'lineitem.tbl', lineitem_columns),
+        ]
+        # Wait for all conversions (and raise any exception that occurred in them).
+        for future in futures:
+            future.result()
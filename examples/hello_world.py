@@ -193,10 +193,16 @@ print(super_pos)
 print(super_neg)
 
 # By extending superstriction to clans, which are sets of sets (of Couplets), we can define a
-# helpful mechanism to restrict vocab_clan to only those relations that contain particular values.
+# helpful mechanism to restrict vocab_clan to only those relations that contain particular values,
+# for example clans.superstrict(vocab_clan, Set(Set(Couplet('meaning', 'salutation')))). Since we
+# need the records for more than one meaning, we partition vocab_clan by meaning instead; this
+# looks at every relation only once. The labeled partition is a function from each meaning to the
+# clan of the relations with this meaning.
 import algebraixlib.algebras.clans as clans
-salutation_records_clan = clans.superstrict(vocab_clan, Set(Set(Couplet('meaning', 'salutation'))))
-earth_records_clan = clans.superstrict(vocab_clan, Set(Set(Couplet('meaning', 'earth'))))
+import algebraixlib.partition as partition
+records_by_meaning = partition.make_labeled_partition(vocab_clan, lambda rel: rel('meaning'))
+salutation_records_clan = records_by_meaning('salutation')
+earth_records_clan = records_by_meaning('earth')
 print("salutation_records_clan:", salutation_records_clan)
 print("earth_records_clan:", earth_records_clan)
 
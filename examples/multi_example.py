@@ -1,5 +1,8 @@
 """This module contains the example code for the algebras created for representing data which has
 multiples.
+
+Set the environment variable ``ALGX_NO_RENDER`` (to a non-empty value) to skip the LaTeX output, for
+example when timing the example.
 """
 
 # Copyright Permission.io, Inc. (formerly known as Algebraix Data Corporation), Copyright (c) 2022.
@@ -16,6 +19,8 @@ multiples.
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import os
+
 import algebraixlib.algebras.multiclans as _multiclans
 import algebraixlib.algebras.multisets as _multisets
 import algebraixlib.mathobjects as _mo
@@ -23,13 +28,19 @@ from algebraixlib.util.latexprinter import math_object_to_latex as _math_object_
 
 # --------------------------------------------------------------------------------------------------
 
+render_latex = not os.environ.get('ALGX_NO_RENDER')
+
 ms_1 = _mo.Multiset({'a': 3, 'b': 3})
 ms_2 = _mo.Multiset({'b': 2, 'c': 1})
 
+# Convert the arguments to strings only once; they are printed with every operation.
+ms_1_str = str(ms_1)
+ms_2_str = str(ms_2)
+
 # Multiset Union operation Example
 simple_union = _multisets.union(ms_1, ms_2)
 
-print(str(ms_1) + ' UNION ' + str(ms_2))
+print(ms_1_str + ' UNION ' + ms_2_str)
 print('=> EVALUATES TO ' + str(simple_union))
 
 ms_3 = _mo.Multiset({'a': 3, 'b': 3, 'c': 1})
@@ -40,7 +51,7 @@ if ms_3 == simple_union:
 # Multiset Intersect Operation Example
 simple_intersect = _multisets.intersect(ms_1, ms_2)
 
-print(str(ms_1) + ' INTERSECT ' + str(ms_2))
+print(ms_1_str + ' INTERSECT ' + ms_2_str)
 print('=> EVALUATES TO ' + str(simple_intersect))
 
 ms_4 = _mo.Multiset({'b': 2})
@@ -51,7 +62,7 @@ if ms_4 == simple_intersect:
 # Multiset Addition operation Example
 simple_addition = _multisets.add(ms_1, ms_2)
 
-print(str(ms_1) + ' ADDITION ' + str(ms_2))
+print(ms_1_str + ' ADDITION ' + ms_2_str)
 print('=> EVALUATES TO ' + str(simple_addition))
 
 ms_5 = _mo.Multiset({'a': 3, 'b': 5, 'c': 1})
@@ -62,7 +73,7 @@ if ms_5 == simple_addition:
 # Multiset Intersect Operation Example
 simple_minus = _multisets.minus(ms_1, ms_2)
 
-print(str(ms_1) + ' MINUS ' + str(ms_2))
+print(ms_1_str + ' MINUS ' + ms_2_str)
 print('=> EVALUATES TO ' + str(simple_minus))
 
 ms_6 = _mo.Multiset({'a': 3, 'b': 1})
@@ -84,11 +95,15 @@ mc_1 = _mo.Multiset({rel_1: 2, rel_3: 3})
 mc_2 = _mo.Multiset({rel_2: 5, rel_4: 1})
 mc_3 = _mo.Multiset({rel_1: 2, rel_6: 7})
 mc_4 = _mo.Multiset({rel_2: 5, rel_5: 11})
+mc_1_str = str(mc_1)
+mc_2_str = str(mc_2)
+mc_3_str = str(mc_3)
+mc_4_str = str(mc_4)
 
 # Multiset Transpose Operation Example
 simple_transpose = _multiclans.transpose(mc_1)
 
-print('TRANSPOSE ' + str(mc_1))
+print('TRANSPOSE ' + mc_1_str)
 print('=> EVALUATES TO ' + str(simple_transpose))
 
 mc_tmp = _mo.Multiset(
@@ -101,7 +116,7 @@ if mc_tmp == simple_transpose:
 # Multiset Compose Operation Example
 simple_compose_1 = _multiclans.compose(mc_1, mc_2)
 
-print(str(mc_1) + ' COMPOSE ' + str(mc_2))
+print(mc_1_str + ' COMPOSE ' + mc_2_str)
 print('=> EVALUATES TO ' + str(simple_compose_1))
 
 print("multiclan's compose applies a cross compose of the relations in each sides multiclan, "
@@ -109,7 +124,7 @@ print("multiclan's compose applies a cross compose of the relations in each side
 
 simple_compose_2 = _multiclans.compose(mc_2, mc_1)
 
-print(str(mc_2) + ' COMPOSE ' + str(mc_1))
+print(mc_2_str + ' COMPOSE ' + mc_1_str)
 print('=> EVALUATES TO ' + str(simple_compose_2))
 
 print("multiclan's compose can result in relation compositions such that two different operations"
@@ -118,7 +133,7 @@ print("multiclan's compose can result in relation compositions such that two dif
 # Multiset Cross Union Operation Example
 simple_cross_union_1 = _multiclans.cross_union(mc_1, mc_2)
 
-print(str(mc_1) + ' CROSS UNION ' + str(mc_2))
+print(mc_1_str + ' CROSS UNION ' + mc_2_str)
 print('=> EVALUATES TO ' + str(simple_cross_union_1))
 
 print("multiclan's cross union applies the relation's union for all relations in the multiclan of "
@@ -127,7 +142,7 @@ print("multiclan's cross union applies the relation's union for all relations in
 
 simple_cross_union_2 = _multiclans.cross_union(mc_3, mc_4)
 
-print(str(mc_3) + ' CROSS UNION ' + str(mc_4))
+print(mc_3_str + ' CROSS UNION ' + mc_4_str)
 print('=> EVALUATES TO ' + str(simple_cross_union_2))
 
 print("multiclan's cross union like other operations can yield the same result for different inner "
@@ -136,7 +151,7 @@ print("multiclan's cross union like other operations can yield the same result f
 # Multiset Cross Intersect Operation Example
 simple_cross_intersect_1 = _multiclans.cross_intersect(mc_1, mc_2)
 
-print(str(mc_1) + ' CROSS INTERSECT ' + str(mc_2))
+print(mc_1_str + ' CROSS INTERSECT ' + mc_2_str)
 print('=> EVALUATES TO ' + str(simple_cross_intersect_1))
 
 print("multiclan's cross intersect applies relation's intersect for all relations in the multiclan "
@@ -145,7 +160,7 @@ print("multiclan's cross intersect applies relation's intersect for all relation
 
 simple_cross_intersect_2 = _multiclans.cross_intersect(mc_3, mc_4)
 
-print(str(mc_3) + ' CROSS INTERSECT ' + str(mc_4))
+print(mc_3_str + ' CROSS INTERSECT ' + mc_4_str)
 print('=> EVALUATES TO ' + str(simple_cross_intersect_2))
 
 print("multiclan's cross intersect can yield the same result for different inner relation intersect"
@@ -189,9 +204,10 @@ print(str("sales_multiclan") + ' COMPOSE ' + str(product_diagonal))
 print('=> EVALUATES TO ' + str(product_sales) + "\n")
 
 # Print some of these new math objects in LaTeX.
-print(_math_object_to_latex(simple_union))
-print(_math_object_to_latex(sales_multiclan))
-print(_math_object_to_latex(product_sales))
+if render_latex:
+    print(_math_object_to_latex(simple_union))
+    print(_math_object_to_latex(sales_multiclan))
+    print(_math_object_to_latex(product_sales))
 
 # Export a multiclan
 print("\nConverting the multiclan back to a csv file is easy.")
@@ -15,6 +15,7 @@
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
 import io
+import os
 import rdflib
 from time import time
 
@@ -22,14 +23,21 @@ from algebraixlib.import_export.rdf import export_table, import_graph
 from algebraixlib.mathobjects import Set
 from algebraixlib.util.html import DataAlgebraHtmlDescriptor as HtmlDesc, math_object_as_html
 from algebraixlib.util.miscellaneous import open_webpage_from_html_str
-from algebraixlib.util.rdf import triple_match, join
+from algebraixlib.util.rdf import multi_triple_match_join
 
 # noinspection PyUnresolvedReferences
-from examples.sampleRdfGraph import sample_graph
+from examples.sample_rdf_graph import sample_graph
 
 
 print_examples = True
-show_results_as_webpage = True
+# Set the environment variable ALGX_NO_RENDER (to a non-empty value) to skip the web page.
+show_results_as_webpage = not os.environ.get('ALGX_NO_RENDER')
+
+# The RDF terms used in the queries. They are created once and shared by all queries.
+rdf_name = rdflib.URIRef('rdf:name')
+rdf_type = rdflib.URIRef('rdf:type')
+cat_engineer = rdflib.URIRef('cat:engineer')
+fav_mathobject = rdflib.URIRef('fav:mathobject')
 
 
 # Print the input graph.
@@ -46,13 +54,14 @@ if print_examples:
     print('Input graph (as MathObject):', graph_algebra)
 
 # Query the MathObject graph, retrieving the id, name and favorite MathObject of all engineers who
-# have all three.
+# have all three. (This is the same as joining the results of three calls to triple_match, but
+# traverses the graph only once.)
 start = time()
-engineers_algebra = join(
-    triple_match(graph_algebra, '?eng', rdflib.URIRef('rdf:name'), '?name'),
-    triple_match(graph_algebra, '?eng', rdflib.URIRef('rdf:type'), rdflib.URIRef('cat:engineer')),
-    triple_match(graph_algebra, '?eng', rdflib.URIRef('fav:mathobject'), '?fav')
-)
+engineers_algebra = multi_triple_match_join(graph_algebra, [
+    (rdf_name, '?name'),
+    (rdf_type, cat_engineer),
+    (fav_mathobject, '?fav')
+], '?eng')
 elapsed_algebra = time() - start
 
 engineers_algebra_json = io.StringIO()
@@ -15,6 +15,7 @@
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
 import io
+import os
 import rdflib
 
 import algebraixlib.algebras.clans as clans
@@ -27,7 +28,13 @@ from examples.sample_rdf_graph import sample_graph
 
 
 print_examples = True
-show_results_as_webpage = True
+# Set the environment variable ALGX_NO_RENDER (to a non-empty value) to skip the web page.
+show_results_as_webpage = not os.environ.get('ALGX_NO_RENDER')
+
+# The RDF terms used in the queries. They are created once and shared by all queries.
+rdf_name = rdflib.URIRef('rdf:name')
+rdf_type = rdflib.URIRef('rdf:type')
+cat_engineer = rdflib.URIRef('cat:engineer')
 
 
 # Import and print the input graph.
@@ -40,12 +47,12 @@ if print_examples:
 # Query the imported graph using general pattern matching APIs.
 names = match_and_project(
     graph_algebra,
-    {'p': rdflib.URIRef('rdf:name')},
+    {'p': rdf_name},
     {'s': '?eng', 'o': '?name'}
 )
 engineers = match_and_project(
     graph_algebra,
-    {'p': rdflib.URIRef('rdf:type'), 'o': rdflib.URIRef('cat:engineer')},
+    {'p': rdf_type, 'o': cat_engineer},
     {'s': '?eng'}
 )
 engs_and_names = clans.cross_functional_union(names, engineers)
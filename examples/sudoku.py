@@ -16,15 +16,13 @@ likely use.  This is a teaching exercise, not an attempt at writing the fastest
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
 import time
-from functools import partial
+from functools import lru_cache, partial
 import itertools
 
 from algebraixlib.cache_status import CacheStatus
 from algebraixlib.mathobjects import Atom, Couplet, Set
-import algebraixlib.algebras.relations as relations
 import algebraixlib.algebras.clans as clans
 import algebraixlib.algebras.sets as sets
-import algebraixlib.extension as extension
 import algebraixlib.partition as partition
 from algebraixlib.undef import Undef
 
@@ -34,15 +32,44 @@ VERBOSE = False
 
 BLOCK_SIZE = 3
 GRID_SIZE = BLOCK_SIZE * BLOCK_SIZE
+# The row, col, band and stack couplets of every cell (row-major), and the value couplet of every
+# value.  The cells and values are built from these, so they are created only once.
+CELL_COUPLETS = [
+    tuple(Couplet(left, right) for left, right in (
+        ('row', i // GRID_SIZE + 1), ('col', i % GRID_SIZE + 1),
+        ('band', i // (GRID_SIZE * BLOCK_SIZE) + 1), ('stack', i % GRID_SIZE // BLOCK_SIZE + 1)))
+    for i in range(GRID_SIZE * GRID_SIZE)]
+VALUE_COUPLETS = {value: Couplet('value', value) for value in range(1, GRID_SIZE + 1)}
 BLOCK_VALUES_CLAN = Set(
-    Set(Couplet('value', i)).cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
+    Set(VALUE_COUPLETS[i]).cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
     for i in range(1, GRID_SIZE + 1)).cache_clan(CacheStatus.IS).cache_functional(
         CacheStatus.IS).cache_regular(CacheStatus.IS)
 BANDS_STACKS = Set(
-    (relations.from_dict({'row': r, 'col': c, 'band': int((r - 1) / BLOCK_SIZE) + 1,
-                          'stack': int((c - 1) / BLOCK_SIZE) + 1})
-     for r, c in itertools.product(list(range(1, GRID_SIZE + 1)), list(range(1, GRID_SIZE + 1))))
-).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS).cache_regular(CacheStatus.IS)
+    (Set(cell_couplets, direct_load=True).cache_relation(CacheStatus.IS).cache_functional(
+        CacheStatus.IS) for cell_couplets in CELL_COUPLETS),
+    direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS).cache_regular(
+        CacheStatus.IS)
+# The lefts of the cells.  Looking up a right by an Atom doesn't need to convert the left first.
+ROW, COL, BAND, STACK, VALUE = (Atom(left) for left in ('row', 'col', 'band', 'stack', 'value'))
+# The lefts that are swapped when rotating the board (see rotate).
+ROTATED_LEFTS = {ROW: COL, COL: ROW, BAND: STACK, STACK: BAND}
+# The clan with the single row of every row number, as project(clan, 'row') returns it.
+ROW_CLANS = {Atom(r): clans.from_dict({'row': r}) for r in range(1, GRID_SIZE + 1)}
+
+# The bit mask with all values as candidates (bit i is set if value i + 1 is a candidate).
+ALL_CANDIDATES = (1 << GRID_SIZE) - 1
+# The cell indexes (row-major, 0-based) of every row, column and block.
+UNITS = \
+    [[r * GRID_SIZE + c for c in range(GRID_SIZE)] for r in range(GRID_SIZE)] + \
+    [[r * GRID_SIZE + c for r in range(GRID_SIZE)] for c in range(GRID_SIZE)] + \
+    [[(band * BLOCK_SIZE + r) * GRID_SIZE + stack * BLOCK_SIZE + c
+      for r, c in itertools.product(range(BLOCK_SIZE), range(BLOCK_SIZE))]
+     for band, stack in itertools.product(range(BLOCK_SIZE), range(BLOCK_SIZE))]
+# The cell indexes that share a row, column or block with a given cell.
+PEERS = [sorted(set(itertools.chain.from_iterable(unit for unit in UNITS if i in unit)) - {i})
+         for i in range(GRID_SIZE * GRID_SIZE)]
+# The indexes (into UNITS) of the units that contain a given cell.
+CELL_UNITS = [[u for u, unit in enumerate(UNITS) if i in unit] for i in range(GRID_SIZE * GRID_SIZE)]
 
 
 def _sorted(iterable, key=None):
@@ -59,18 +86,9 @@ _SORT = _unsorted
 
 def make_board(_puzzle):
     assert len(_puzzle) == GRID_SIZE * GRID_SIZE
-    board = set()
-    for i, value in enumerate(_puzzle):
-        value = 0 if value == '.' else int(value)
-        col = (i % GRID_SIZE) + 1
-        row = int(i / GRID_SIZE) + 1
-        band = int((row - 1) / BLOCK_SIZE) + 1
-        stack = int((col - 1) / BLOCK_SIZE) + 1
-        # cell = {'row': row, 'col': col}
-        cell = {'row': row, 'col': col, 'band': band, 'stack': stack}
-        if value != 0:
-            cell['value'] = value
-        board.add(relations.from_dict(cell))
+    board = [Set(cell_couplets if value in '.0' else cell_couplets + (VALUE_COUPLETS[int(value)],),
+                 direct_load=True).cache_relation(CacheStatus.IS).cache_functional(CacheStatus.IS)
+             for cell_couplets, value in zip(CELL_COUPLETS, _puzzle)]
     return Set(board, direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
 
 
@@ -89,28 +107,38 @@ def by_keys(key1, key2, rel):
     return val1, val2
 
 
+# The clans passed to by_clan_key and by_clan_keys are partitions by the given keys, so all their
+# relations have the same values for them; it is enough to look at any one relation.
 def by_clan_key(key, clan):
-    return sets.single(clan[key])
+    return next(iter(clan))(key)
 
 
 def by_clan_keys(key1, key2, clan):
-    val1 = sets.single(clan[key1])
-    val2 = sets.single(clan[key2])
-    return val1, val2
+    rel = next(iter(clan))
+    return rel(key1), rel(key2)
 
 
-def get_string(board):
-    digits = []
-    for cell in sorted(board, key=partial(by_keys, 'row', 'col')):
-        value = cell('value')
-        digits.append(0 if value is Undef() else value.value)
+# The partition and sort keys, created once instead of for every call.
+BY_ROW = partial(by_key, ROW)
+BY_VALUE = partial(by_key, VALUE)
+BY_ROW_COL = partial(by_keys, ROW, COL)
+BY_BAND_STACK = partial(by_keys, BAND, STACK)
+BY_CLAN_ROW = partial(by_clan_key, ROW)
+BY_CLAN_COL = partial(by_clan_key, COL)
+BY_CLAN_VALUE = partial(by_clan_key, VALUE)
+BY_CLAN_BAND_STACK = partial(by_clan_keys, BAND, STACK)
 
-    assert len(digits) == GRID_SIZE * GRID_SIZE
-    return ''.join(str(x) for x in digits)
+
+def get_string(board):
+    assert board.cardinality == GRID_SIZE * GRID_SIZE
+    # get_values places every cell at its index; no need to sort the cells.
+    return ''.join(str(x) for x in get_values(board))
 
 
 def get_filled_cells(board):
-    return clans.defined_at(board, Atom('value'), _checked=False)
+    # Same as clans.defined_at(board, Atom('value')), without the generic per-relation checks.
+    return Set((cell for cell in board if cell(VALUE) is not Undef()), direct_load=True).cache_clan(
+        CacheStatus.IS).cache_functional(CacheStatus.IS)
 
 
 def project(clan: 'PP(M x M)', *lefts) -> 'PP(M x M)':
@@ -118,20 +146,52 @@ def project(clan: 'PP(M x M)', *lefts) -> 'PP(M x M)':
     return clan
 
 
+def project_two(clan: 'PP(M x M)', lefts1, lefts2) -> ('PP(M x M)', 'PP(M x M)'):
+    """Return project(clan, *lefts1) and project(clan, *lefts2), with a single pass over clan."""
+    lefts1 = {Atom(left) for left in lefts1}
+    lefts2 = {Atom(left) for left in lefts2}
+    rels1 = set()
+    rels2 = set()
+    for rel in clan:
+        rels1.add(Set((couplet for couplet in rel if couplet.left in lefts1), direct_load=True))
+        rels2.add(Set((couplet for couplet in rel if couplet.left in lefts2), direct_load=True))
+    return tuple(
+        Set(rels, direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+        for rels in (rels1, rels2))
+
+
 def get_missing_values(clan):
     """Get remaining values from passed in clan by subtracting it from from all possible values."""
-    values_clan = project(clan, 'value')
-    return sets.minus(BLOCK_VALUES_CLAN, values_clan)
+    mask = 0
+    for rel in clan:
+        value = rel(VALUE)
+        if value is not Undef():
+            mask |= 1 << (value.value - 1)
+    return get_missing_values_by_mask(mask)
+
+
+@lru_cache(maxsize=None)
+def get_missing_values_by_mask(mask):
+    """Get the values of BLOCK_VALUES_CLAN that are not in the bit mask of values mask.  There are
+    only 2 ** GRID_SIZE masks, so this is cached."""
+    return Set((rel for rel in BLOCK_VALUES_CLAN if not mask & (1 << (rel(VALUE).value - 1))),
+               direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+
+
+@lru_cache(maxsize=GRID_SIZE)
+def get_block_rowcols(band, stack):
+    """Get the rows/cols of the block defined by band, stack.  BANDS_STACKS is constant, so this
+    is cached."""
+    full_block_clan = clans.superstrict(BANDS_STACKS,
+                                        clans.from_dict({'band': band, 'stack': stack}))
+    return project(full_block_clan, 'row', 'col')
 
 
 def get_missing_rowcols(block_clan):
-    band, stack = by_clan_keys('band', 'stack', block_clan)
+    band, stack = by_clan_keys(BAND, STACK, block_clan)
 
-    # Get block defined by band, stack
-    full_block_clan = clans.superstrict(BANDS_STACKS,
-                                        clans.from_dict({'band': band, 'stack': stack}))
     # Get missing rows/cols from the block
-    target_rowcols = sets.minus(project(full_block_clan, 'row', 'col'),
+    target_rowcols = sets.minus(get_block_rowcols(band, stack),
                                 project(block_clan, 'row', 'col'))
     return target_rowcols
 
@@ -139,9 +199,9 @@ def get_missing_rowcols(block_clan):
 def get_new_board(board, new_cells):
     if VERBOSE:
         for cell in new_cells:
-            row = cell('row').value
-            col = cell('col').value
-            value = cell('value').value
+            row = cell(ROW).value
+            col = cell(COL).value
+            value = cell(VALUE).value
             print("*** value %d goes in Row %d, Col %d" % (value, row, col))
 
     cell_filter = project(new_cells, 'row', 'col')
@@ -170,8 +230,8 @@ def check_values(_board):
     board = get_filled_cells(_board)
 
     new_cells = Set()
-    value_clans = partition.partition(board, partial(by_key, 'value'))
-    for value_clan in _SORT(value_clans, key=partial(by_clan_key, 'value')):
+    value_clans = partition.partition(board, BY_VALUE)
+    for value_clan in _SORT(value_clans, key=BY_CLAN_VALUE):
         # If there is only 1 missing value..fill in the cell
         if value_clan.cardinality == GRID_SIZE - 1:
             # Get the set of rows and cols containing value
@@ -198,26 +258,29 @@ def check_rows(_board, try_harder=0):
     if VERBOSE:
         print("* check_rows")
     board = get_filled_cells(_board)
+    values = get_values(board)
+    placed_mask = get_values_mask(values)
 
-    all_rows_clans = partition.partition(board, partial(by_key, 'row'))
-    for row_clan in _SORT(all_rows_clans, key=partial(by_clan_key, 'row')):
-        row = project(row_clan, 'row')
-        board_row = clans.superstrict(_board, row)
+    all_rows_clans = partition.partition(board, BY_ROW)
+    for row_clan in _SORT(all_rows_clans, key=BY_CLAN_ROW):
+        row_atom = by_clan_key(ROW, row_clan)
+        row = ROW_CLANS[row_atom]
         values_clan = get_missing_values(row_clan)
 
         if row_clan.cardinality == GRID_SIZE - 1:
             # Row is missing only 1 value, remove row_clan from the board leaving target row_col
+            board_row = clans.superstrict(_board, row)
             row_col = sets.minus(board_row, row_clan)
             new_cells = clans.cross_union(row_col, values_clan)
             _board = get_new_board(_board, new_cells)
             try_harder = 0
             continue
 
-        # Get the set of candidate col/value pairs
-        row_possible = clans.cross_union(values_clan,
-                                         project(sets.minus(board_row, row_clan), 'col'))
-
         if row_clan.cardinality == GRID_SIZE - 2:
+            # Get the set of candidate col/value pairs (only needed here)
+            board_row = clans.superstrict(_board, row)
+            row_possible = clans.cross_union(values_clan,
+                                             project(sets.minus(board_row, row_clan), 'col'))
 
             # The occupied_clan is the col/value pair that is a conflict for each col/value
             occupied_clan = project(clans.superstrict(board, row_possible), 'col', 'value')
@@ -251,48 +314,32 @@ def check_rows(_board, try_harder=0):
                 try_harder = 0
                 continue
 
-        # The occupied_clan is the row/col/value set that could be a conflict for values
-        occupied_clan = clans.superstrict(board, values_clan)
-
-        # If there are no conflicts then no cells can be placed
-        if occupied_clan.is_empty:
+        # If no other cell holds one of the missing values there are no conflicts, and no cells
+        # can be placed
+        missing_values = [rel(VALUE).value for rel in values_clan]
+        missing_mask = sum(1 << (value - 1) for value in missing_values)
+        if not missing_mask & placed_mask:
             continue
 
-        # Add row to row_possible for remaining checks
-        all_possible = clans.cross_union(row_possible, row)
-
-        # Get the set of conflicts...conflicting row/value + col/value
-        conflict = sets.union(
-            clans.superstrict(all_possible,
-                              project(occupied_clan, 'value', 'col')),
-            clans.superstrict(all_possible,
-                              project(occupied_clan, 'value', 'row')))
-
-        # Remove the conflicts from all_possible
-        new_possible = sets.minus(all_possible, conflict)
-
-        if new_possible.is_empty:
-            continue  # All possible may have been excluded due to row/col conflicts
-
-        # Otherwise...need to check for block (band+stack) conflicts too!!
-        # ...if value exists in same block as element of all_possible
-
-        # Add band/stack
-        new_targets = clans.superstrict(BANDS_STACKS, project(new_possible, 'row', 'col'))
-        new_possible3 = clans.cross_functional_union(new_targets, new_possible)
-        occupied_clan2 = occupied_clan
-
-        # Remove block (band+stack) conflicts
-        new_possible4a = sets.minus(project(new_possible3, 'value', 'band', 'stack'),
-                                    project(occupied_clan2, 'value', 'band', 'stack'))
-        new_possible4 = clans.superstrict(new_possible3, new_possible4a)
+        # Get the candidate row/col/value/band/stack relations without a row, col or block
+        # conflict.  The peers of a cell are static, so the conflicts of a cell are the values
+        # of its peers.
+        row_index = row_atom.value - 1
+        new_possible4 = Set(
+            (Set(CELL_COUPLETS[index] + (VALUE_COUPLETS[value],), direct_load=True).cache_relation(
+                CacheStatus.IS).cache_functional(CacheStatus.IS)
+             for index in range(row_index * GRID_SIZE, (row_index + 1) * GRID_SIZE)
+             if not values[index]
+             for peer_mask in [get_peers_mask(values, index)]
+             for value in missing_values if not peer_mask & (1 << (value - 1))),
+            direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
 
         while True:
             candidates_updated = False
             # Partition by row/col
             placed = 0
-            candidates = partition.partition(new_possible4, partial(by_keys, 'row', 'col'))
-            for candidate in _SORT(candidates, key=partial(by_clan_key, 'col')):
+            candidates = partition.partition(new_possible4, BY_ROW_COL)
+            for candidate in _SORT(candidates, key=BY_CLAN_COL):
                 # If any row/col has only 1 candidate, place it
                 if candidate.cardinality == 1:
                     # Remove band/stack
@@ -303,8 +350,8 @@ def check_rows(_board, try_harder=0):
                 break
 
             # Partition by value
-            candidates = partition.partition(new_possible4, partial(by_key, 'value'))
-            for candidate in _SORT(candidates, key=partial(by_clan_key, 'value')):
+            candidates = partition.partition(new_possible4, BY_VALUE)
+            for candidate in _SORT(candidates, key=BY_CLAN_VALUE):
                 # If any value fits in only 1 cell, place it
                 if candidate.cardinality == 1:
                     # Remove band/stack
@@ -314,10 +361,10 @@ def check_rows(_board, try_harder=0):
                     if try_harder:
                         value = project(candidate, 'value')
                         # If this row of a sibling block must contain this value...
-                        blocks = partition.partition(candidate, partial(by_keys, 'band', 'stack'))
+                        blocks = partition.partition(candidate, BY_BAND_STACK)
                         if blocks.cardinality > 1:
                             for block_clan in _SORT(blocks,
-                                                    key=partial(by_clan_keys, 'band', 'stack')):
+                                                    key=BY_CLAN_BAND_STACK):
                                 block = project(block_clan, 'band', 'stack')
                                 board_block = clans.superstrict(board, block)
                                 if board_block.is_empty:
@@ -343,19 +390,26 @@ def check_cols(_board, try_harder=0):
         print("* check_cols")
 
     # Rotate the board by swapping row and col then call check_rows
-    swaps = clans.from_dict({'row': 'col', 'band': 'stack'})
-    rotated = extension.binary_extend(
-        _board, swaps, partial(relations.swap, _checked=False)).cache_clan(
-            CacheStatus.IS).cache_functional(CacheStatus.IS)
+    rotated = rotate(_board)
 
     new_board = check_rows(rotated, try_harder)
+    # check_rows returns the board it got if it didn't place anything; only rotate back otherwise.
     if rotated is not new_board:
-        _board = extension.binary_extend(
-            new_board, swaps, partial(relations.swap, _checked=False)
-        ).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+        _board = rotate(new_board)
     return _board
 
 
+def rotate(board):
+    """Swap row and col, and band and stack, in every cell of board.  This is what
+    extension.binary_extend(board, swaps, relations.swap) does for the swaps
+    {'row'->'col', 'band'->'stack'}, but maps the lefts directly."""
+    return Set(
+        (Set((Couplet(ROTATED_LEFTS.get(couplet.left, couplet.left), couplet.right,
+                      direct_load=True) for couplet in cell), direct_load=True).cache_relation(
+            CacheStatus.IS).cache_functional(CacheStatus.IS) for cell in board),
+        direct_load=True).cache_clan(CacheStatus.IS).cache_functional(CacheStatus.IS)
+
+
 def get_block_candidates(block_clan, board):
     # Get the set of missing values...see if any can be placed due to row/col information
     values_clan = get_missing_values(block_clan)
@@ -384,10 +438,10 @@ def get_block_candidates(block_clan, board):
 
     all_possible = clans.cross_union(values_clan, target_rowcols).cache_functional(CacheStatus.IS)
 
-    # Get the set of conflicts...conflicting row/value + col/value
-    conflict = sets.union(
-        clans.superstrict(all_possible, project(occupied_clan, 'value', 'col')),
-        clans.superstrict(all_possible, project(occupied_clan, 'value', 'row')))
+    # Get the set of conflicts...conflicting row/value + col/value (superstrict with a union is the
+    # union of the superstricts)
+    conflict = clans.superstrict(
+        all_possible, sets.union(*project_two(occupied_clan, ('value', 'col'), ('value', 'row'))))
 
     # Remove the conflicts from all_possible
     new_possible = sets.minus(all_possible, conflict)
@@ -400,8 +454,8 @@ def check_blocks(_board):
         print("* check_blocks")
 
     board = get_filled_cells(_board)
-    blocks = partition.partition(board, partial(by_keys, 'band', 'stack'))
-    for block_clan in _SORT(blocks, key=partial(by_clan_keys, 'band', 'stack')):
+    blocks = partition.partition(board, BY_BAND_STACK)
+    for block_clan in _SORT(blocks, key=BY_CLAN_BAND_STACK):
         new_possible, conflict = get_block_candidates(block_clan, board)
 
         if new_possible.is_empty:
@@ -434,8 +488,8 @@ def check_blocks(_board):
             continue
 
         # Partition by value
-        candidates = partition.partition(new_possible, partial(by_key, 'value'))
-        for candidate in _SORT(candidates, key=partial(by_clan_key, 'value')):
+        candidates = partition.partition(new_possible, BY_VALUE)
+        for candidate in _SORT(candidates, key=BY_CLAN_VALUE):
             # If any value fits in only 1 cell, place it
             if candidate.cardinality == 1:
                 # Remove band/stack
@@ -456,30 +510,180 @@ def check_done(_board):
     return False
 
 
-def solve_board(board):
+def get_values(board):
+    """Return the values of board as a row-major list of ints (0 for an empty cell)."""
+    values = [0] * (GRID_SIZE * GRID_SIZE)
+    for cell in board:
+        value = cell(VALUE)
+        if value is not Undef():
+            values[(cell(ROW).value - 1) * GRID_SIZE + cell(COL).value - 1] = value.value
+    return values
+
+
+def get_values_mask(values):
+    """Return the bit mask of the values that occur in values."""
+    mask = 0
+    for value in values:
+        if value:
+            mask |= 1 << (value - 1)
+    return mask
+
+
+def get_peers_mask(values, index):
+    """Return the bit mask of the values of the peers of the cell at index."""
+    return get_values_mask(values[peer] for peer in PEERS[index])
+
+
+def place_value(values, candidates, index, value, changed):
+    """Place value in the cell at index and remove it from the candidates of the cell's peers.
+    Append the cell and the peers whose candidates changed to changed."""
+    values[index] = value
+    candidates[index] = 0
+    changed.append(index)
+    bit = 1 << (value - 1)
+    for peer in PEERS[index]:
+        if candidates[peer] & bit:
+            candidates[peer] &= ~bit
+            changed.append(peer)
+
+
+def naked_single(values, candidates, index, changed):
+    """If the cell at index has only one candidate value left, fill it in.  Return the number of
+    placed values."""
+    cell_candidates = candidates[index]
+    # A single bit is set if clearing the lowest bit leaves nothing.
+    if cell_candidates and not cell_candidates & (cell_candidates - 1):
+        place_value(values, candidates, index, cell_candidates.bit_length(), changed)
+        return 1
+    return 0
+
+
+def hidden_singles(values, candidates, unit, changed):
+    """Fill in the values that have only one candidate cell left in unit (a row, column or block).
+    Return the number of placed values."""
+    once = twice = 0
+    for index in unit:
+        twice |= once & candidates[index]
+        once |= candidates[index]
+    singles = once & ~twice
+    placed = 0
+    while singles:
+        bit = singles & -singles
+        singles ^= bit
+        for index in unit:
+            if candidates[index] & bit:
+                place_value(values, candidates, index, bit.bit_length(), changed)
+                placed += 1
+                break
+    return placed
+
+
+def solve_values(values):
+    """Fill in the cells that have only one candidate value left, and the values that have only one
+    candidate cell left in a row, column or block (what check_values, check_rows, check_cols and
+    check_blocks look for), until no more cells can be placed.  The candidates of every cell are
+    kept as a bit mask, so this works on plain lists of ints instead of sets of relations.
+
+    Placing a value only changes the candidates of its peers, so only these cells (and their units)
+    are checked again; this is a worklist like in the AC-3 constraint propagation algorithm."""
+    values = list(values)
+    candidates = [0 if value else ALL_CANDIDATES for value in values]
+    changed = []
+    for index, value in enumerate(values):
+        if value:
+            place_value(values, candidates, index, value, changed)
+
+    # Initially all cells and units need to be checked.
+    changed = list(range(GRID_SIZE * GRID_SIZE))
+    dirty_units = set(range(len(UNITS)))
+    while changed or dirty_units:
+        while changed:
+            index = changed.pop()
+            if not values[index]:
+                naked_single(values, candidates, index, changed)
+            dirty_units.update(CELL_UNITS[index])
+        # Check the units of all changed cells in one batch.
+        units, dirty_units = dirty_units, set()
+        for unit in units:
+            hidden_singles(values, candidates, UNITS[unit], changed)
+    return values
+
+
+def search_values(values):
+    """Solve values with a depth-first search: fill in the singles with solve_values, then try every
+    candidate value of the empty cell with the fewest candidates (the minimum remaining values
+    heuristic).  Return the solved values, or None if values has no solution."""
+    values = solve_values(values)
+    best_index = None
+    best_count = GRID_SIZE + 1
+    for index, value in enumerate(values):
+        peers_mask = get_peers_mask(values, index)
+        if value:
+            if peers_mask & (1 << (value - 1)):
+                return None  # The value conflicts with one of its peers.
+        else:
+            cell_candidates = ALL_CANDIDATES & ~peers_mask
+            count = bin(cell_candidates).count('1')
+            if count == 0:
+                return None
+            if count < best_count:
+                best_index, best_count, best_candidates = index, count, cell_candidates
+    if best_index is None:
+        return values
+
+    while best_candidates:
+        bit = best_candidates & -best_candidates
+        best_candidates ^= bit
+        trial = list(values)
+        trial[best_index] = bit.bit_length()
+        solved = search_values(trial)
+        if solved is not None:
+            return solved
+    return None
+
+
+def solve_board(board, fast_solver=False):
+    """Solve board with the data algebra techniques of the check_* functions.  If fast_solver is
+    True, solve it on lists of ints with candidate bit masks instead (see search_values); the board
+    is converted from and to the data algebra only at the start and the end."""
+    if fast_solver:
+        solved_values = search_values(get_values(board))
+        if solved_values is None:
+            if VERBOSE:
+                print("*** can't solve")
+            return board
+        return make_board(''.join(str(value) for value in solved_values))
+
+    # Run the phases from the cheapest to the most expensive one, and go back to the cheapest
+    # phase after every phase that placed cells.  The check_* functions return the board they got
+    # if they didn't place anything, so an identity check tells whether a phase placed cells.
     try_harder = 0
     while not check_done(board):
         board_start = board
         board = check_values(board)
+        if board is not board_start:
+            continue
         board = check_rows(board, try_harder)
-        if board_start is not board:
+        if board is not board_start:
             try_harder = 0
+            continue
         board = check_cols(board, try_harder)
-        if board_start is not board:
+        if board is not board_start:
             try_harder = 0
+            continue
         board = check_blocks(board)
-        if board_start is board:
-            if try_harder == 0:
-                if VERBOSE:
-                    print("*** no cells placed..trying harder")
-                try_harder = 1
-            elif try_harder == 1:
-                if VERBOSE:
-                    print("*** can't solve")
-                break
+        if board is not board_start:
+            try_harder = 0
+            continue
+
+        if try_harder == 0:
+            if VERBOSE:
+                print("*** no cells placed..trying harder")
+            try_harder = 1
         else:
-            if try_harder:
-                try_harder = 0
+            if VERBOSE:
+                print("*** can't solve")
+            break
 
     return board
 
@@ -695,20 +899,33 @@ class SudokuTest(unittest.TestCase):
                 self.assertTrue(solve_puzzle(puzzle_solution[0].rstrip(), expected))
         print()
 
+    def test_solve_values(self):
+        puzzle = '003020600900305001001806400008102900700000008006708200002609500800203009005010300'
+        answer = '483921657967345821251876493548132976729564138136798245372689514814253769695417382'
+        values = get_values(make_board(puzzle))
+        self.assertEqual(''.join(str(value) for value in solve_values(values)), answer)
+        # Two missing values without conflicts: neither can be placed.
+        values = [int(value) for value in '.2345678.'.replace('.', '0')] + [0] * 72
+        self.assertEqual(solve_values(values), values)
+
+    def test_search(self):
+        """A puzzle that needs a search after the singles are placed (only the fast solver
+        searches)."""
+        self._test_func(
+            '800000000003600000070090200050007000000045700000100030001000068008500010090000400',
+            '812753649943682175675491283154237896369845721287169534521974368438526917796318452',
+            partial(solve_board, fast_solver=True))
+        values = [int(value) for value in '11' + '0' * 79]
+        self.assertIsNone(search_values(values))
+
     def test_one(self):
         """Use this to test solving an entire puzzle..first test of e50.txt"""
-        self._test_func(
-            '003020600900305001001806400008102900700000008006708200002609500800203009005010300',
-            '483921657967345821251876493548132976729564138136798245372689514814253769695417382',
-            solve_board)
+        for fast_solver in (False, True):
+            self._test_func(
+                '003020600900305001001806400008102900700000008006708200002609500800203009005010300',
+                '483921657967345821251876493548132976729564138136798245372689514814253769695417382',
+                partial(solve_board, fast_solver=fast_solver))
 
 
-# noinspection PyPackageRequirements
-import nose
 if __name__ == '__main__':
-    ARGUMENTS = [
-        '-s', '--nocapture', '-v',  # Don't capture stdout (show it in the console).
-        '--with-coverage',  # Include unit test coverage
-        '--tests=sudoku.py',
-    ]
-    nose.main(argv=ARGUMENTS)
+    unittest.main(verbosity=2)
@@ -66,8 +66,7 @@ print('america_nations_names:\n' + mo_to_str(america_nations_names))
 #   return <pair>{$x/../../regionkey}{$x}</pair>
 from algebraixlib.mathobjects import Set
 from algebraixlib.algebras.clans import project, cross_union
-from algebraixlib.algebras.sets import union
-region_key_nation_name_pairs_accumulator = Set()
+region_key_nation_name_pairs_per_region = []
 for region in regions:
     region_key = project(Set(region), 'regionkey')
     print('region_key:\n' + mo_to_str(region_key))
@@ -81,11 +80,12 @@ for region in regions:
     region_key_nation_name_pairs = cross_union(region_key, region_nation_names)
     print('region_key_nation_name_pairs:\n' + mo_to_str(region_key_nation_name_pairs))
 
-    region_key_nation_name_pairs_accumulator = union(
-        region_key_nation_name_pairs_accumulator, region_key_nation_name_pairs)
-    print('region_key_nation_name_pairs_accumulator:\n' + mo_to_str(
-        region_key_nation_name_pairs_accumulator))
+    region_key_nation_name_pairs_per_region.append(region_key_nation_name_pairs)
 
+# Collect the pairs of all regions in a single set (instead of a union per region, which copies
+# the growing accumulator every time).
+region_key_nation_name_pairs_accumulator = Set(
+    pair for region_pairs in region_key_nation_name_pairs_per_region for pair in region_pairs)
 print('region_key_nation_name_pairs_accumulator:\n' + mo_to_str(
     region_key_nation_name_pairs_accumulator))
 
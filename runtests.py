@@ -2,7 +2,8 @@
 
 """Run all unit tests. 
 
-This script requires the packages nose and coverage (available from PyPI, install using pip).
+This script requires the packages pytest, pytest-xdist and pytest-cov (available from PyPI, install
+using pip, for example with ``pip install algebraixlib[test]``).
 """
 
 # Copyright Permission.io, Inc. (formerly known as Algebraix Data Corporation), Copyright (c) 2022.
@@ -24,7 +25,7 @@ import os.path as path
 import sys
 
 # noinspection PyPackageRequirements
-import nose
+import pytest
 
 # --------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
@@ -36,17 +37,18 @@ if __name__ == '__main__':
     dirpath = path.dirname(filepath)
 
     # The print is not really necessary. It helps making sure we always know what we ran in the IDE.
-    print('main: {file} --where={dir}'.format(file=path.basename(filepath), dir=dirpath))
+    print('main: {file} --rootdir={dir}'.format(file=path.basename(filepath), dir=dirpath))
 
     arguments = [
-        '-s', '--nocapture', '-v',  # Don't capture stdout (show it in the console).
-        '--all-modules',  # Run tests in all modules (so that __main__ tests run).
-        '--with-doctest',  # Include doctests.
-        '--with-coverage',  # Include unit test coverage.
-        '--cover-package=algebraixlib',  # Exclude 3rd party code from unit test coverage report.
-        '--where=' + dirpath,  # Enable invocation from an external path.
-
-        # --all-modules makes the following functions being run so we exclude them:
-        '--exclude=create_test_object|get_test_file_(name|path)'
+        '-s', '-v',  # Don't capture stdout (show it in the console).
+        '-n', 'auto',  # Distribute the tests across one worker process per CPU (pytest-xdist).
+        '--doctest-modules',  # Include doctests.
+        '--cov=algebraixlib',  # Include unit test coverage (only of algebraixlib).
+        '--rootdir=' + dirpath,  # Enable invocation from an external path.
+        path.join(dirpath, 'test'),
     ]
-    nose.main(argv=arguments)
+    # Also collect the doctests of the library if it is next to this script (in a working copy).
+    library_path = path.join(dirpath, 'algebraixlib')
+    if path.isdir(library_path):
+        arguments.append(library_path)
+    sys.exit(pytest.main(arguments))
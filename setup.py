@@ -16,22 +16,16 @@
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
-from sys import version_info, exit
-from setuptools import setup
-from setup_data import setup_data  # Local import.
+import os
+import sys
 
+from setuptools import setup
 
-# Check python version. This doesn't run in a wheel install.
-python_version = str(version_info[0]) + '.' + str(version_info[1]) + '.' + str(version_info[2])
-if version_info < (3, 0):
-    exit('The current Python Version is ' + python_version + '. '
-         + 'This library requires Python Version 3. Exiting.')
-elif version_info < (3, 4):
-    print('Warning: The current Python Version is ' + python_version + '. '
-          + 'This library has been tested with Python Version 3.4.3. Use at your own risk.')
-elif version_info < (3, 4, 3):
-    print('Note: The current Python Version is ' + python_version + '. '
-          + 'This library has been tested with Python Version 3.4.3.')
+# The standard 'setuptools.build_meta' backend doesn't put this directory on sys.path.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from setup_data import setup_data  # Local import.
 
 
+# The required Python version is declared in setup_data ('python_requires'), so that pip checks it
+# also for wheel installs, without running this file.
 setup(**setup_data)
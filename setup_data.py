@@ -56,9 +56,17 @@ setup_data = {
         'Topic :: Software Development :: Libraries',
         'Topic :: Software Development :: Libraries :: Python Modules',
     ],
-    'packages': find_packages(exclude='test'),
+    'packages': find_packages(exclude=['test', 'test.*']),
+    'python_requires': '>=3.4',
     'install_requires': [
         'rdflib>=4.2'
     ],
+    'extras_require': {
+        'test': [
+            'pytest',
+            'pytest-cov',
+            'pytest-xdist',
+        ],
+    },
     'keywords': 'data algebra set theory',
 }
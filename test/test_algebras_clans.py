@@ -104,6 +104,15 @@ class ClansTest(unittest.TestCase):
         self.assertEqual(result.cached_right_functional, CacheStatus.UNKNOWN)
         self.assertEqual(result.cached_regular, CacheStatus.UNKNOWN)
 
+        # A clan with a single relation on either side.
+        c3 = from_dict({'k': 1})
+        c4 = Set(Set(Couplet('a', 1)), Set(Couplet('a', 2), Couplet('k', 1)), Set())
+        expected = Set(Set(Couplet('a', 1), Couplet('k', 1)), Set(Couplet('a', 2), Couplet('k', 1)),
+                       Set(Couplet('k', 1)))
+        self.assertEqual(cross_union(c3, c4), expected)
+        self.assertEqual(cross_union(c4, c3), expected)
+        self.assertEqual(cross_union(c3, Set()), Set())
+
     def test_cross_functional_union(self):
         """Basic tests of clans.cross_functional_union()."""
         self._check_wrong_argument_types_binary(cross_functional_union)
@@ -117,6 +126,26 @@ class ClansTest(unittest.TestCase):
 
         self.assertEqual(result.cached_functional, CacheStatus.IS)
 
+        # Regular clans (joined on the rights of their common lefts).
+        c1 = Set(Set(Couplet('k', 1), Couplet('a', 'x')), Set(Couplet('k', 2), Couplet('a', 'y')),
+                 Set(Couplet('k', 3), Couplet('a', 'x')))
+        c2 = Set(Set(Couplet('k', 1), Couplet('b', 'u')), Set(Couplet('k', 1), Couplet('b', 'v')),
+                 Set(Couplet('k', 2), Couplet('b', 'w')))
+        result = cross_functional_union(c1, c2)
+        self.assertEqual(result, Set(
+            Set(Couplet('k', 1), Couplet('a', 'x'), Couplet('b', 'u')),
+            Set(Couplet('k', 1), Couplet('a', 'x'), Couplet('b', 'v')),
+            Set(Couplet('k', 2), Couplet('a', 'y'), Couplet('b', 'w'))))
+        self.assertEqual(result.cached_functional, CacheStatus.IS)
+        self.assertEqual(c1.cached_regular, CacheStatus.UNKNOWN)
+        # No common lefts: every pair of relations is unioned.
+        self.assertEqual(len(cross_functional_union(c1, from_dict({'c': 0}))), 3)
+        # A clan that is not regular.
+        c3 = Set(Set(Couplet('k', 1)), Set(Couplet('k', 2), Couplet('b', 'w')))
+        self.assertEqual(cross_functional_union(c1, c3), Set(
+            Set(Couplet('k', 1), Couplet('a', 'x')),
+            Set(Couplet('k', 2), Couplet('a', 'y'), Couplet('b', 'w'))))
+
     def test_right_functional_cross_union(self):
         """Basic tests of clans.cross_right_functional_union()."""
         self._check_wrong_argument_types_binary(cross_right_functional_union)
@@ -217,6 +246,27 @@ class ClansTest(unittest.TestCase):
         self.assertEqual(result.cached_symmetric, CacheStatus.IS)
         self.assertEqual(result.cached_transitive, CacheStatus.IS)
 
+        # A relation that is a superset of several relations of the second clan is in the result
+        # once; relations that match no relation of the second clan are not.
+        c3 = Set(Set(Couplet('a', 1), Couplet('b', 2)), Set(Couplet('a', 2)), Set(Couplet('b', 2)))
+        c4 = Set(Set(Couplet('a', 1)), Set(Couplet('b', 2)), Set(Couplet('a', 3)))
+        self.assertEqual(superstrict(c3, c4),
+                         Set(Set(Couplet('a', 1), Couplet('b', 2)), Set(Couplet('b', 2))))
+        self.assertEqual(superstrict(c3, Set(Set())), c3)
+
+        # Point queries (a single relation in the second clan).
+        c5 = Set(Set(Couplet('name', 'ASIA'), Couplet('key', 2)),
+                 Set(Couplet('name', 'EUROPE'), Couplet('key', 3)),
+                 Set(Couplet('name', 'ASIA'), Couplet('key', 4)))
+        self.assertEqual(superstrict(c5, from_dict({'name': 'ASIA'})),
+                         Set(Set(Couplet('name', 'ASIA'), Couplet('key', 2)),
+                             Set(Couplet('name', 'ASIA'), Couplet('key', 4))))
+        self.assertEqual(superstrict(c5, from_dict({'name': 'EUROPE'})),
+                         Set(Set(Couplet('name', 'EUROPE'), Couplet('key', 3))))
+        self.assertEqual(superstrict(c5, from_dict({'name': 'ASIA', 'key': 4})),
+                         Set(Set(Couplet('name', 'ASIA'), Couplet('key', 4))))
+        self.assertEqual(superstrict(c5, from_dict({'name': 'AFRICA'})), Set())
+
     def test_get_lefts(self):
         """Basic tests of clans.get_lefts()."""
         self._check_wrong_argument_type_unary(get_lefts)
@@ -361,6 +411,15 @@ class ClansTest(unittest.TestCase):
         self.assertIs(project(c1, Undef()), Undef())
         c2 = Set(Set(Couplet('a', 1)), Set(Couplet('a', 4)))
         self.assertEqual(project(c1, 'a'), c2)
+        self.assertEqual(project(c1, 'a', 'c', 'x'), compose(c1, diag('a', 'c', 'x')))
+        c3 = Set(Set(Couplet('a', 1)), Set(Couplet('b', 2)))
+        self.assertEqual(project(c3, 'a'), Set(Set(Couplet('a', 1)), Set()))
+        # Lefts that compare equal in Python but not as Atoms (1, True, 1.0) are kept apart.
+        c4 = Set(Set(Couplet(True, 't'), Couplet(1, 'one'), Couplet(1.0, 'one.0')))
+        self.assertEqual(project(c4, 1), Set(Set(Couplet(1, 'one'))))
+        self.assertEqual(project(c4, True), Set(Set(Couplet(True, 't'))))
+        self.assertEqual(project(c4, 1.0), Set(Set(Couplet(1.0, 'one.0'))))
+        self.assertEqual(project(c4, 1, True), Set(Set(Couplet(True, 't'), Couplet(1, 'one'))))
 
     def test_from_set(self):
         """Basic tests of clans.from_set()."""
@@ -65,6 +65,30 @@ class MulticlansTest(unittest.TestCase):
         expected = ac['clan2comp1']
         self.assertEqual(result, expected)
 
+    def test_compose_diagonal(self):
+        """Composition with a diagonal is a projection."""
+        mclan = Multiset({Set(Couplet('a', 1), Couplet('b', 2)): 2,
+                          Set(Couplet('a', 1), Couplet('b', 3)): 1,
+                          Set(Couplet('c', 4)): 3})
+        self.assertEqual(compose(mclan, diag('a')), Multiset({Set(Couplet('a', 1)): 3, Set(): 3}))
+        self.assertEqual(compose(mclan, Multiset({Set(Couplet('b', 'b'), Couplet('c', 'c')): 2})),
+                         Multiset({Set(Couplet('b', 2)): 4, Set(Couplet('b', 3)): 2,
+                                   Set(Couplet('c', 4)): 6}))
+        self.assertEqual(project(mclan, 'a', 'b'), Multiset({
+            Set(Couplet('a', 1), Couplet('b', 2)): 2, Set(Couplet('a', 1), Couplet('b', 3)): 1,
+            Set(): 3}))
+
+    def test_compose_non_functional(self):
+        """Composition of relations with several rights per left."""
+        mclan1 = Multiset({Set(Couplet('x', 'p'), Couplet('x', 'q'), Couplet('y', 'r')): 2,
+                           Set(Couplet('z', 'p')): 1})
+        mclan2 = Multiset({Set(Couplet('a', 'x'), Couplet('b', 'x'), Couplet('c', 'y')): 3,
+                           Set(Couplet('d', 'w')): 1})
+        self.assertEqual(compose(mclan1, mclan2), Multiset({
+            Set(Couplet('a', 'p'), Couplet('a', 'q'), Couplet('b', 'p'), Couplet('b', 'q'),
+                Couplet('c', 'r')): 6,
+            Set(): 6}))
+
     def test_transpose(self):
         """Basic tests of clans.transpose()."""
         self._check_wrong_argument_type_unary(transpose)
@@ -106,6 +130,15 @@ class MulticlansTest(unittest.TestCase):
         result = cross_intersect(ac['clan1'], ac['clan3'])
         self.assertEqual(result, ac['clan1inters3'])
 
+    def test_reversed_arguments(self):
+        """Operations with the multiclan arguments in the other order."""
+        mc1 = ac['clan1']
+        mc2 = ac['clan2']
+        mc3 = ac['clan3']
+        self.assertEqual(compose(mc2, mc1), ac['clan2comp1'])
+        self.assertEqual(cross_union(mc2, mc1), ac['clan1union2'])
+        self.assertEqual(cross_intersect(mc3, mc1), ac['clan1inters3'])
+
     def test_substrict(self):
         """Basic tests of clans.substrict()."""
         self._check_wrong_argument_types_binary(substrict)
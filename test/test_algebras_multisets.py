@@ -101,6 +101,8 @@ class MultiSetsTest(unittest.TestCase):
         self._check_wrong_argument_types_binary(union)
         result = union(_set1, _set2)
         self.assertEqual(result, _set1u2)
+        self.assertIs(union(_set1, Multiset()), _set1)
+        self.assertIs(union(Multiset(), _set2), _set2)
         abc_ab_ac = Multiset([Multiset('a', 'b', 'c'), Multiset('a', 'b'), Multiset('a', 'c'),
                               Multiset('a', 'c')])
         ab_c = _ab_c
@@ -133,12 +135,16 @@ class MultiSetsTest(unittest.TestCase):
 
         result = minus(_set1, _set2)
         self.assertEqual(result, _set1m2)
+        self.assertIs(minus(_set1, Multiset()), _set1)
+        self.assertEqual(minus(Multiset(), _set1), Multiset())
 
     def test_addition(self):
         self._check_wrong_argument_types_binary(add)
 
         result = add(_set1, _set2)
         self.assertEqual(result, _set1a2)
+        self.assertIs(add(_set1, Multiset()), _set1)
+        self.assertIs(add(Multiset(), _set2), _set2)
 
     def test_is_subset_of(self):
         self._check_wrong_argument_types_binary(is_subset_of)
@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import io
 import inspect
 import os
 import unittest
@@ -105,6 +106,42 @@ class IoCsvTests(unittest.TestCase):
         actual = import_csv(export_path, has_dup_rows=True)
         self.assertEqual(actual, expected)
 
+    def test_csv_repeated_values(self):
+        """Test that repeated values in a column are converted once and share their couplet."""
+        converted = []
+
+        def to_int(value):
+            converted.append(value)
+            return int(value)
+
+        data = io.StringIO('a,b\n1,x\n1,y\n2,x\n')
+        clan = import_csv(data, {'a': to_int})
+        self.assertEqual(clan, Set(Set(Couplet('a', 1), Couplet('b', 'x')),
+                                   Set(Couplet('a', 1), Couplet('b', 'y')),
+                                   Set(Couplet('a', 2), Couplet('b', 'x'))))
+        self.assertEqual(sorted(converted), ['1', '2'])
+        couplets_a1 = [couplet for rel in clan for couplet in rel if couplet == Couplet('a', 1)]
+        self.assertEqual(len(couplets_a1), 2)
+        self.assertIs(couplets_a1[0], couplets_a1[1])
+
+    def test_csv_dup_rows_counted(self):
+        """Test that duplicate rows are counted, also when they differ only before conversion."""
+        data = io.StringIO('a,b\n1,x\n1,x\n\n01,x\n2,y\n')
+        mclan = import_csv(data, {'a': int}, has_dup_rows=True)
+        self.assertEqual(mclan, Multiset({Set(Couplet('a', 1), Couplet('b', 'x')): 3,
+                                          Set(Couplet('a', 2), Couplet('b', 'y')): 1}))
+        self.assertEqual(mclan.cached_regular, CacheStatus.IS)
+
+    def test_export_csv_rows(self):
+        """Test that missing and ambiguous values are exported as empty cells."""
+        clan = Set(Set(Couplet('a', 1), Couplet('b', 2)),
+                   Set(Couplet('a', 3), Couplet('b', 4), Couplet('b', 5)),
+                   Set(Couplet('b', 6)))
+        out = io.StringIO()
+        self.assertTrue(export_csv(clan, out, ordered_lefts=['a', 'b'],
+                                   sort_key=lambda rel: sorted(c.right.value for c in rel)))
+        self.assertEqual(out.getvalue(), 'a,b\r\n1,2\r\n3,\r\n,6\r\n')
+
 
 # --------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
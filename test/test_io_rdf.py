@@ -14,6 +14,7 @@
 # You should have received a copy of the GNU Lesser General Public License along with algebraixlib.
 # If not, see <http://www.gnu.org/licenses/>.
 # --------------------------------------------------------------------------------------------------
+import concurrent.futures
 import inspect
 import io
 import os
@@ -30,7 +31,9 @@ from data_rdf import basic_graphs as bg, result_tables as rt
 from algebraixlib.import_export.rdf import _convert_identifier_to_mathobject, import_graph, \
     export_table
 from algebraixlib.util.rdf import is_file_url, get_file_url, is_triple, is_absolute_triple, \
-    is_graph, is_absolute_graph, triple_match, join, make_triple
+    is_graph, is_absolute_graph, triple_match, join, make_triple, \
+    multi_triple_match_join, pattern_match, \
+    evaluate_bgp
 
 # This graph is extracted from examples.sampleRdfGraph.py
 sample_graph = """
@@ -246,6 +249,61 @@ class RdfTest(unittest.TestCase):
         # Verify that the number of sets matched equals the number of types in the graph
         self.assertEqual(len(triples_matched), graph_type_cnt)
 
+    def test_evaluate_bgp(self):
+        graph = import_graph(io.StringIO(sample_graph), rdf_format='turtle')
+        patterns = [
+            ('?eng', URIRef('rdf:name'), '?name'),
+            ('?eng', URIRef('rdf:type'), URIRef('cat:engineer')),
+            ('?eng', URIRef('fav:mathobject'), '?fav'),
+        ]
+        expected = join(*[triple_match(graph, *pattern) for pattern in patterns])
+        self.assertEqual(evaluate_bgp(graph, patterns), expected)
+        # Patterns that are joined on other variables than the subject.
+        patterns = [
+            ('?eng', URIRef('rdf:type'), '?type'),
+            ('?other', URIRef('rdf:type'), '?type'),
+            ('?other', URIRef('rdf:name'), '?name'),
+        ]
+        expected = join(*[triple_match(graph, *pattern) for pattern in patterns])
+        self.assertEqual(evaluate_bgp(graph, patterns), expected)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(evaluate_bgp(graph, patterns, executor), expected)
+        self.assertEqual(evaluate_bgp(graph, patterns[:1]), triple_match(graph, *patterns[0]))
+        self.assertEqual(evaluate_bgp(graph, [('?s', URIRef('rdf:unknown'), '?o')] + patterns),
+                         Set())
+
+    def test_pattern_match(self):
+        graph = import_graph(io.StringIO(sample_graph), rdf_format='turtle')
+        matches = pattern_match(graph, {'p': URIRef('rdf:type'), 'o': URIRef('cat:engineer')})
+        self.assertEqual(matches, Set(
+            make_triple(URIRef('id:jeff'), URIRef('rdf:type'), URIRef('cat:engineer')),
+            make_triple(URIRef('id:james'), URIRef('rdf:type'), URIRef('cat:engineer'))))
+        self.assertEqual(pattern_match(graph, {}), graph)
+        self.assertEqual(pattern_match(graph, {'p': URIRef('rdf:unknown')}), Set())
+
+    def test_multi_triple_match_join(self):
+        graph = import_graph(io.StringIO(sample_graph), rdf_format='turtle')
+        patterns = [
+            (URIRef('rdf:name'), '?name'),
+            (URIRef('rdf:type'), URIRef('cat:engineer')),
+            (URIRef('fav:mathobject'), '?fav'),
+        ]
+        expected = join(*[triple_match(graph, '?eng', predicate, object_)
+                          for predicate, object_ in patterns])
+        self.assertEqual(multi_triple_match_join(graph, patterns, '?eng'), expected)
+        self.assertEqual(len(expected), 1)
+        # Repeated variables must bind the same value.
+        patterns = [(URIRef('rdf:type'), '?x'), ('?p', '?x')]
+        expected = join(*[triple_match(graph, '?s', predicate, object_)
+                          for predicate, object_ in patterns])
+        self.assertEqual(multi_triple_match_join(graph, patterns, '?s'), expected)
+        # A single pattern only has the functional matches, like a join and like evaluate_bgp.
+        graph = Set(make_triple('a', 'p', 'a'), make_triple('a', 'p', 'b'))
+        expected = Set(Set(Couplet('?s', 'a')))
+        self.assertEqual(multi_triple_match_join(graph, [('p', '?s')], '?s'), expected)
+        self.assertEqual(evaluate_bgp(graph, [('?s', 'p', '?s')]), expected)
+        self.assertRaises(AssertionError, lambda: multi_triple_match_join(Atom(1), [], '?s'))
+
     def test_join_binary(self):
         clan1 = Set(Set([Couplet(1, 'one')]))
         clan2 = Set(Set([Couplet(2, 'two')]))
@@ -17,10 +17,11 @@
 import inspect
 import io
 import os
+import tempfile
 import unittest
 
 from algebraixlib.import_export.json import import_json
-from algebraixlib.import_export.xml import import_xml
+from algebraixlib.import_export.xml import import_xml, xml_to_str
 from algebraixlib.mathobjects import Atom, Couplet, Set
 
 
@@ -112,6 +113,36 @@ class IoXmlTests(unittest.TestCase):
             ))
         self.assertEqual(xml_set, expected)
 
+    def test_xml_shared_atoms(self):
+        """Test that values that repeat in the data share a single Atom"""
+        xml_text = """<?xml version="1.0"?>
+            <r><a>ASIA</a><b>ASIA</b><c k="ASIA" n="1"/><d>1</d><e>1.0</e></r>
+            """
+        rel = import_xml(io.StringIO(xml_text), convert_numerics=True)('r')
+        self.assertIs(rel('a'), rel('b'))
+        self.assertIs(rel('a'), rel('c')('k'))
+        self.assertIs(rel('c')('n'), rel('d'))
+        self.assertEqual(rel('d'), Atom(1))
+        self.assertEqual(rel('e'), Atom(1.0))
+        self.assertNotEqual(rel('d'), rel('e'))
+
+    def test_xml_to_str(self):
+        """Test the formatting of XML files and that a changed file is read again"""
+        xml_text = '<?xml version="1.0"?><r><a>ASIA</a></r>'
+        expected = '<?xml version="1.0" ?>\n<r>\n   <a>ASIA</a>\n</r>\n'
+        self.assertEqual(xml_to_str(io.StringIO(xml_text), truncate=False), expected)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'test.xml')
+            with open(file_path, 'w', encoding='utf-8') as xml_file:
+                xml_file.write(xml_text)
+            self.assertEqual(xml_to_str(file_path, truncate=False), expected)
+
+            with open(file_path, 'w', encoding='utf-8') as xml_file:
+                xml_file.write('<?xml version="1.0"?><r><b>EUROPE</b></r>')
+            self.assertEqual(xml_to_str(file_path, truncate=False),
+                             '<?xml version="1.0" ?>\n<r>\n   <b>EUROPE</b>\n</r>\n')
+
 # --------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
     # The print is not really necessary. It helps making sure we always know what we ran in the IDE.
@@ -132,6 +132,18 @@ class LatexPrinterTest(unittest.TestCase):
             print('Exp={l!s}'.format(l=latex_set_ex))
             print("Test End.")
 
+    def test_set_printer_config(self):
+        """Repeated conversions give the same result and follow configuration changes."""
+        self._enable_colorization(False)
+        latex_plain = math_object_to_latex(self._s3)
+        self.assertEqual(latex_plain, math_object_to_latex(Set([self._s2, self._s1])))
+        self._enable_colorization(True)
+        latex_colored = math_object_to_latex(self._s3)
+        self.assertNotEqual(latex_plain, latex_colored)
+        self.assertIn(r'\color', latex_colored)
+        self._enable_colorization(False)
+        self.assertEqual(latex_plain, math_object_to_latex(self._s3))
+
 # --------------------------------------------------------------------------------------------------
 if __name__ == '__main__':
     # The print is not really necessary. It helps making sure we always know what we ran in the IDE.
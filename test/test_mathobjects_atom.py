@@ -37,7 +37,7 @@ class AtomTest(unittest.TestCase):
     def test_atom(self):
         """Create various forms of Atoms."""
         if self.print_examples:
-            print('(printing examples)')  # Make 'nosetests -s' more readable.
+            print('(printing examples)')  # Make 'pytest -s' more readable.
         for test_key in ba.keys():
             self._atom_assert(test_key)
 
@@ -48,7 +48,7 @@ class CoupletTest(unittest.TestCase):
     def test_Couplet(self):
         """Create various forms of Couplets."""
         if self.print_examples:
-            print('(printing examples)')  # Make 'nosetests -s' more readable.
+            print('(printing examples)')  # Make 'pytest -s' more readable.
         for test_couplet_name in basic_couplets.keys():
             self._couplet_assert(test_couplet_name)
 
@@ -165,6 +165,23 @@ class CoupletTest(unittest.TestCase):
         s = str(Couplet(1, 2))
         self.assertEqual(s, '(1->2)')
 
+    def test__hash__(self):
+        """Verify that equal couplets hash equal and that the hash depends on the order."""
+        self.assertEqual(hash(Couplet(1, 2)), hash(Couplet(Atom(1), Atom(2))))
+        self.assertNotEqual(hash(Couplet(1, 2)), hash(Couplet(2, 1)))
+
+    def test__eq__(self):
+        """Verify that (in)equality doesn't depend on whether the hashes are already calculated."""
+        c1, c2, c3 = Couplet(1, 2), Couplet(1, 2), Couplet(1, 3)
+        self.assertTrue(c1 == c2 and c1 != c3 and not c1 != c2 and not c1 == c3)
+        hash(c1)
+        self.assertTrue(c1 == c2 and c1 != c3 and not c1 != c2 and not c1 == c3)
+        hash(c2)
+        hash(c3)
+        self.assertTrue(c1 == c2 and c1 != c3 and not c1 != c2 and not c1 == c3)
+        self.assertFalse(Couplet(1, 2) == Couplet(True, 2))
+        self.assertTrue(Couplet(1, 2) != Couplet(True, 2))
+
     def test_optional_right(self):
         """Test optional right"""
         c1 = Couplet(1, 1)
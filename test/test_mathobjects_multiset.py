@@ -38,7 +38,7 @@ class MultisetTest(unittest.TestCase):
 #     def test_Multiset(self):
 #         """Create various forms of Sets."""
 #         if self.print_examples:
-#             print('(printing examples)')  # Make 'nosetests -s' more readable.
+#             print('(printing examples)')  # Make 'pytest -s' more readable.
 #         for test_set_name in basic_multisets.keys():
 #             self._multiset_assert(test_set_name)
 #         self.assertEqual("{}", str(Multiset()))
@@ -30,7 +30,7 @@ from algebraixlib.structure import CartesianProduct, GenesisSetA, PowerSet, Stru
 from algebraixlib.undef import Undef
 
 # noinspection PyProtectedMember
-from algebraixlib.import_export.csv import _convert_clan_to_list_of_dicts, export_csv
+from algebraixlib.import_export.csv import _convert_clan_to_rows, export_csv
 # noinspection PyUnresolvedReferences
 from data_mathobjects import basic_sets, basic_clans, algebra_clans, basic_hordes
 
@@ -62,7 +62,7 @@ class SetTest(unittest.TestCase):
     def test_Set(self):
         """Create various forms of Sets."""
         if self.print_examples:
-            print('(printing examples)')  # Make 'nosetests -s' more readable.
+            print('(printing examples)')  # Make 'pytest -s' more readable.
         for test_set_name in basic_sets.keys():
             self._set_assert(test_set_name)
         self.assertEqual("{}", str(Set()))
@@ -258,6 +258,8 @@ class SetTest(unittest.TestCase):
         self.assertEqual(algebra_clans['clan5']['b'], Set(2, 5))
         self.assertEqual(algebra_clans['clan5']['c'], Set(3))
         self.assertEqual(algebra_clans['clan5']['d'], Set())
+        self.assertEqual(algebra_clans['clan5'][Atom('b')], Set(2, 5))
+        self.assertEqual(Set(Set(Couplet('a', Set('x'))), Set(Couplet('a', 1)))['a'], Set(Set('x'), 1))
 
     def test_right_functional(self):
         self.assertTrue(is_right_functional(Set()))
@@ -409,7 +411,7 @@ class SetTest(unittest.TestCase):
 
         if self.print_examples:
             ss = clan.get_left_set()
-            pc = _convert_clan_to_list_of_dicts(ss, clan)
+            pc = list(_convert_clan_to_rows(ss, clan))
             print(clan)
             print(ss)
             print(pc)
@@ -263,7 +263,7 @@ class StructureTest(unittest.TestCase):
         :param my_class: The class type of the members of `testobjects`.
         """
         if self.print_examples:
-            print('(printing examples)')  # Make 'nosetests -s' more readable.
+            print('(printing examples)')  # Make 'pytest -s' more readable.
             for obj in testobjects.values():
                 print('{msg1} {msg2} (str): {str}'.format(
                     msg1=my_class.__name__, msg2=obj._test_msg, str=str(obj)))